@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Aggregate-and-Detect Skill - Compute metrics and detect anomalies in one call
+"""
+
+from __future__ import annotations
+import sys
+import json
+from pathlib import Path
+from typing import Dict
+
+# Ensure repo root is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.parent))
+
+from src.agentX.shared.utils import load_skill, read_skill_input, serve_skill, write_skill_output
+
+
+AGGREGATE_LOGS = ".agents/skills/aggregate_logs/scripts/run.py"
+DETECT_ANOMALIES = ".agents/skills/detect_anomalies/scripts/run.py"
+
+
+def run(input_data: Dict) -> Dict:
+    """
+    Main execution function for fused aggregation and anomaly detection
+    
+    Args:
+        input_data: {
+            "events": [...],
+            "time_range": "24h",
+            "baseline_file": "config/baseline_metrics.json",
+            "thresholds": "config/anomaly_thresholds.yaml"
+        }
+    
+    Returns:
+        {
+            "metrics": {...},        # aggregate_logs result
+            "anomalies": [...],
+            "total_anomalies": int,
+            "detection_time": str
+        }
+    """
+    metrics = load_skill(AGGREGATE_LOGS).run({
+        "events": input_data.get("events", []),
+        "time_range": input_data.get("time_range", "24h"),
+        "baseline_file": input_data.get("baseline_file", "config/baseline_metrics.json")
+    })
+    detection = load_skill(DETECT_ANOMALIES).run({
+        "metrics": metrics,
+        "thresholds": input_data.get("thresholds", "config/anomaly_thresholds.yaml")
+    })
+    return {"metrics": metrics, **detection}
+
+
+def main():
+    """CLI entry point"""
+    if "--serve" in sys.argv[1:]:
+        serve_skill(run)
+        return
+    try:
+        input_data = read_skill_input()
+        output = run(input_data)
+        write_skill_output(output)
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON input - {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
+
+# Example usage:
+# cat events.json | uv run .agents/skills/aggregate_and_detect/scripts/run.py
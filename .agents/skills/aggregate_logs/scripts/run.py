@@ -15,7 +15,10 @@ from typing import Dict, List, Any, Optional
 # Ensure repo root is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.parent))
 
-from src.agentX.shared.utils import parse_time_range
+from src.agentX.shared.utils import parse_time_range, read_skill_input, serve_skill, write_skill_output
+
+# Relative config and output paths resolve against the repo root
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
 
 
 def compute_hourly_trends(events: List[Dict], time_range: str) -> List[Dict]:
@@ -128,7 +131,7 @@ def compute_top_signatures(events: List[Dict], limit: int = 10) -> List[Dict]:
 
 def compute_baseline_comparison(current_metrics: Dict, baseline_file: str = "config/baseline_metrics.json") -> Optional[Dict]:
     """Compare current metrics with historical baseline"""
-    baseline_path = Path(baseline_file)
+    baseline_path = REPO_ROOT / baseline_file
     
     if not baseline_path.exists():
         return None
@@ -229,7 +232,7 @@ def run(input_data: Dict) -> Dict:
     }
     
     # Save metrics to output directory
-    output_dir = Path("output")
+    output_dir = REPO_ROOT / "output"
     output_dir.mkdir(exist_ok=True)
     with open(output_dir / "metrics.json", "w") as f:
         json.dump(result, f, indent=2)
@@ -239,10 +242,13 @@ def run(input_data: Dict) -> Dict:
 
 def main():
     """CLI entry point"""
+    if "--serve" in sys.argv[1:]:
+        serve_skill(run)
+        return
     try:
-        input_data = json.load(sys.stdin)
+        input_data = read_skill_input()
         output = run(input_data)
-        print(json.dumps(output, indent=2))
+        write_skill_output(output)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON input - {e}", file=sys.stderr)
         sys.exit(1)
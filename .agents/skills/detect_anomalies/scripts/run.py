@@ -14,7 +14,10 @@ from typing import Dict, List, Any, Optional
 # Ensure repo root is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.parent))
 
-from src.agentX.shared.utils import load_config
+from src.agentX.shared.utils import load_config, read_skill_input, serve_skill, write_skill_output
+
+# Relative config and output paths resolve against the repo root
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
 
 
 # Default anomaly thresholds
@@ -42,7 +45,7 @@ DEFAULT_THRESHOLDS = {
 
 def load_thresholds(threshold_file: str = "config/anomaly_thresholds.yaml") -> Dict:
     """Load anomaly detection thresholds from config"""
-    thresholds = load_config(threshold_file)
+    thresholds = load_config(REPO_ROOT / threshold_file)
     if thresholds is None:
         thresholds = DEFAULT_THRESHOLDS
     else:
@@ -163,7 +166,7 @@ def run(input_data: Dict) -> Dict:
     }
     
     # Save anomalies
-    output_dir = Path("output")
+    output_dir = REPO_ROOT / "output"
     output_dir.mkdir(exist_ok=True)
     with open(output_dir / "anomalies.json", "w") as f:
         json.dump(result, f, indent=2)
@@ -173,10 +176,13 @@ def run(input_data: Dict) -> Dict:
 
 def main():
     """CLI entry point"""
+    if "--serve" in sys.argv[1:]:
+        serve_skill(run)
+        return
     try:
-        input_data = json.load(sys.stdin)
+        input_data = read_skill_input()
         output = run(input_data)
-        print(json.dumps(output, indent=2))
+        write_skill_output(output)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON input - {e}", file=sys.stderr)
         sys.exit(1)
@@ -13,7 +13,7 @@ from typing import Dict, List, Any
 # Ensure repo root is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.parent))
 
-from src.agentX.shared.utils import parse_time_range, load_config
+from src.agentX.shared.utils import parse_time_range, load_config, read_skill_input, serve_skill, write_skill_output
 
 
 def fetch_from_filesystem(source: Dict, time_range: str, filters: Dict) -> List[Dict]:
@@ -129,10 +129,13 @@ def run(input_data: Dict) -> Dict:
 
 def main():
     """CLI entry point"""
+    if "--serve" in sys.argv[1:]:
+        serve_skill(run)
+        return
     try:
-        input_data = json.load(sys.stdin)
+        input_data = read_skill_input()
         output = run(input_data)
-        print(json.dumps(output, indent=2))
+        write_skill_output(output)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON input - {e}", file=sys.stderr)
         sys.exit(1)
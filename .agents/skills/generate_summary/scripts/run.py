@@ -13,6 +13,11 @@ from typing import Dict, List, Any
 # Ensure repo root is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.parent))
 
+from src.agentX.shared.utils import read_skill_input, serve_skill, write_skill_output
+
+# Relative config and output paths resolve against the repo root
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
+
 
 SUMMARY_TEMPLATE = """# System Log Summary – {environment}
 **Time Range**: Last {time_range}
@@ -213,7 +218,7 @@ def run(input_data: Dict) -> Dict:
     }
     
     # Save summary
-    output_dir = Path("output")
+    output_dir = REPO_ROOT / "output"
     output_dir.mkdir(exist_ok=True)
     with open(output_dir / "summary.md", "w") as f:
         f.write(summary)
@@ -223,10 +228,13 @@ def run(input_data: Dict) -> Dict:
 
 def main():
     """CLI entry point"""
+    if "--serve" in sys.argv[1:]:
+        serve_skill(run)
+        return
     try:
-        input_data = json.load(sys.stdin)
+        input_data = read_skill_input()
         output = run(input_data)
-        print(json.dumps(output, indent=2))
+        write_skill_output(output)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON input - {e}", file=sys.stderr)
         sys.exit(1)
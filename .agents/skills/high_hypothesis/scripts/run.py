@@ -13,7 +13,10 @@ from typing import Dict, List, Any
 # Ensure repo root is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.parent))
 
-from src.agentX.shared.utils import load_config
+from src.agentX.shared.utils import load_config, read_skill_input, serve_skill, write_skill_output
+
+# Relative config and output paths resolve against the repo root
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
 
 
 def generate_hypothesis_for_anomaly(anomaly: Dict, metrics: Dict, context: Dict) -> List[Dict]:
@@ -165,7 +168,7 @@ def run(input_data: Dict) -> Dict:
     }
     
     # Save hypotheses
-    output_dir = Path("output")
+    output_dir = REPO_ROOT / "output"
     output_dir.mkdir(exist_ok=True)
     with open(output_dir / "hypotheses.json", "w") as f:
         json.dump(result, f, indent=2)
@@ -175,10 +178,13 @@ def run(input_data: Dict) -> Dict:
 
 def main():
     """CLI entry point"""
+    if "--serve" in sys.argv[1:]:
+        serve_skill(run)
+        return
     try:
-        input_data = json.load(sys.stdin)
+        input_data = read_skill_input()
         output = run(input_data)
-        print(json.dumps(output, indent=2))
+        write_skill_output(output)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON input - {e}", file=sys.stderr)
         sys.exit(1)
@@ -14,6 +14,8 @@ from typing import Dict, List, Any
 # Ensure repo root is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.parent))
 
+from src.agentX.shared.utils import json_dumps_bytes, json_loads
+
 
 def log_step(step_name: str, message: str):
     """Log a pipeline step with timestamp"""
@@ -23,15 +25,15 @@ def log_step(step_name: str, message: str):
 
 def run_pipeline_step(skill_path: str, input_data: Dict) -> Dict:
     """Run a single skill step and return output"""
+    # Bytes both ways: stdout goes straight to the JSON parser undecoded
     result = subprocess.run(
         ["uv", "run", skill_path],
-        input=json.dumps(input_data),
-        capture_output=True,
-        text=True
+        input=json_dumps_bytes(input_data),
+        capture_output=True
     )
     if result.returncode != 0:
-        raise RuntimeError(f"Step failed: {result.stderr}")
-    return json.loads(result.stdout)
+        raise RuntimeError(f"Step failed: {result.stderr.decode(errors='replace')}")
+    return json_loads(result.stdout)
 
 
 def run(input_data: Dict) -> Dict:
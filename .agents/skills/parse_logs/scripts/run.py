@@ -9,12 +9,16 @@ import json
 import re
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Any
 
 # Ensure repo root is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent.parent.parent))
 
-from src.agentX.shared.utils import extract_error_signature, parse_timestamp
+from src.agentX.shared.utils import read_skill_input, serve_skill, write_skill_output
+
+# Relative config and output paths resolve against the repo root
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent
 
 
 # Common log patterns
@@ -35,21 +39,29 @@ def extract_error_signature_from_message(message: str, level: str) -> str:
     """Extract error signature from log message"""
     if level not in ["ERROR", "FATAL", "CRITICAL"]:
         return "INFO"
-    
+    return _error_signature(message)
+
+
+# Error bursts repeat the same text; only error-level messages reach this
+# cache, and parse_entries clears it once a batch is done
+@lru_cache(maxsize=4096)
+def _error_signature(message: str) -> str:
+    """Classify an error-level message (memoized per distinct message)"""
     # Common error patterns
-    if "timeout" in message.lower():
+    message_lower = message.lower()
+    if "timeout" in message_lower:
         return "TIMEOUT"
-    if "connection" in message.lower() and ("refused" in message.lower() or "failed" in message.lower()):
+    if "connection" in message_lower and ("refused" in message_lower or "failed" in message_lower):
         return "CONNECTION_ERROR"
-    if "database" in message.lower() and "timeout" in message.lower():
+    if "database" in message_lower and "timeout" in message_lower:
         return "DB_TIMEOUT"
-    if "auth" in message.lower() and "fail" in message.lower():
+    if "auth" in message_lower and "fail" in message_lower:
         return "AUTH_FAILED"
-    if "rate limit" in message.lower():
+    if "rate limit" in message_lower:
         return "RATE_LIMIT"
-    if "out of memory" in message.lower() or "oom" in message.lower():
+    if "out of memory" in message_lower or "oom" in message_lower:
         return "OOM"
-    if "null pointer" in message.lower() or "nullpointerexception" in message.lower():
+    if "null pointer" in message_lower or "nullpointerexception" in message_lower:
         return "NULL_POINTER"
     
     # Generic error
@@ -122,25 +134,8 @@ def parse_log_entry(log: Dict) -> Dict:
     }
 
 
-def run(input_data: Dict) -> Dict:
-    """
-    Main execution function for log parsing
-    
-    Args:
-        input_data: {
-            "logs": [...],
-            "parsing_rules": "config/log_patterns.yaml"
-        }
-    
-    Returns:
-        {
-            "events": [...],
-            "parsed_count": int,
-            "failed_count": int
-        }
-    """
-    logs = input_data.get("logs", [])
-    
+def parse_entries(logs: List[Dict]) -> tuple[List[Dict], List[Dict]]:
+    """Parse log entries, returning (events, failed)"""
     events = []
     failed = []
     
@@ -154,9 +149,15 @@ def run(input_data: Dict) -> Dict:
                 "error": str(e)
             })
     
-    # Save failed parses if any
+    # Serve-mode workers and pool processes outlive one batch
+    _error_signature.cache_clear()
+    return events, failed
+
+
+def build_result(events: List[Dict], failed: List[Dict]) -> Dict:
+    """Save failed parses and assemble the skill output"""
     if failed:
-        output_dir = Path("output")
+        output_dir = REPO_ROOT / "output"
         output_dir.mkdir(exist_ok=True)
         with open(output_dir / "parsing_failures.json", "w") as f:
             json.dump(failed, f, indent=2)
@@ -169,12 +170,37 @@ def run(input_data: Dict) -> Dict:
     }
 
 
+def run(input_data: Dict) -> Dict:
+    """
+    Main execution function for log parsing
+    
+    Args:
+        input_data: {
+            "logs": [...],
+            "parsing_rules": "config/log_patterns.yaml"
+        }
+    
+    Returns:
+        {
+            "events": [...],
+            "parsed_count": int,
+            "failed_count": int
+        }
+    """
+    logs = input_data.get("logs", [])
+    events, failed = parse_entries(logs)
+    return build_result(events, failed)
+
+
 def main():
     """CLI entry point"""
+    if "--serve" in sys.argv[1:]:
+        serve_skill(run)
+        return
     try:
-        input_data = json.load(sys.stdin)
+        input_data = read_skill_input()
         output = run(input_data)
-        print(json.dumps(output, indent=2))
+        write_skill_output(output)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON input - {e}", file=sys.stderr)
         sys.exit(1)
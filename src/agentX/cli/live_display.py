@@ -20,7 +20,7 @@ from rich.style import Style
 from rich import box
 from rich.box import ROUNDED, HEAVY
 
-from .output import GRADIENT_PALETTES, _console
+from .output import GRADIENT_PALETTES, _get_console
 
 # Animation frames
 SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
@@ -36,7 +36,7 @@ class LiveStatusDisplay:
         transient: bool = False,
         refresh_per_second: float = 4.0,
     ):
-        self.console = console or _console
+        self.console = console or _get_console()
         self.transient = transient
         self.refresh_per_second = refresh_per_second
         self._live: Optional[Live] = None
@@ -153,7 +153,7 @@ class LivePipelineDisplay:
         console: Console = None,
         refresh_per_second: float = 8.0,
     ):
-        self.console = console or _console
+        self.console = console or _get_console()
         self.refresh_per_second = refresh_per_second
         self._live: Optional[Live] = None
         self._steps: List[Dict[str, Any]] = []
@@ -292,7 +292,7 @@ class LiveProgressBar:
         console: Console = None,
         transient: bool = True,
     ):
-        self.console = console or _console
+        self.console = console or _get_console()
         self.transient = transient
         self._progress: Optional[Progress] = None
         self._task_id: Optional[int] = None
@@ -350,7 +350,7 @@ class LiveStatusPanel:
         console: Console = None,
         refresh_per_second: float = 4.0,
     ):
-        self.console = console or _console
+        self.console = console or _get_console()
         self.refresh_per_second = refresh_per_second
         self.title = title
         self.sections: Dict[str, Any] = {}
@@ -16,13 +16,12 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from .animation import AnimatedSpinner, ThinkingIndicator
 from .live_display import LivePipelineDisplay, LiveProgressBar, LiveStatusPanel
 from .prompts import InteractivePrompter, create_prompter, PromptTheme
-from questionary import Choice, Separator
 from .output import (
     OutputFormatter, print_gradient_with_rule, print_header, print_success,
     print_error, print_warning, print_info, print_title, print_gradient_title,
     print_arrow_line, print_gradient, print_animated_gradient, print_gradient_panel,
     print_gradient_rule, print_gradient_box, print_centered_box,
-    print_gradient_inline_multiple_text_with_rows, GRADIENT_PALETTES, Align,
+    print_gradient_inline_multiple_text_with_rows, GRADIENT_PALETTES,
 )
 PADDING = (2, 5)
 
@@ -566,6 +565,8 @@ quit        Exit the interactive mode
 
     def cmd_interactive_list_mode(self) -> int:
         """Enhanced list mode with questionary + rich select prompts."""
+        from questionary import Choice, Separator
+
         prompter = create_prompter(theme="ocean", use_colors=self.use_colors)
         
         # Define menu items with rich descriptions
@@ -685,6 +686,8 @@ quit        Exit the interactive mode
 
     def cmd_interactive_select_mode(self) -> int:
         """Enhanced select mode with rich styling and animations."""
+        from questionary import Choice
+
         prompter = create_prompter(theme="midnight", use_colors=self.use_colors)
         
         # Categories for organized selection
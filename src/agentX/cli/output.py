@@ -6,21 +6,29 @@ Enhanced with rich-gradient for animated gradients, panels, and rules.
 from __future__ import annotations
 
 import asyncio
+import functools
+import io
+import itertools
 import json
+import os
+import re
+import signal
+from contextlib import contextmanager
 from shutil import get_terminal_size
 import sys
 import threading
 import time
+import types
 from datetime import datetime
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
 from rich import print as rprint
-from rich.console import Console
+from rich.console import Console, Group
 from rich.box import ROUNDED, HEAVY, ASCII, DOUBLE
 from rich.rule import Rule
 from rich_gradient import Gradient, Panel, AnimatedGradient, AnimatedPanel
 from rich.text import Text
 from rich.segment import Segment
-from rich.align import Align
+from rich.align import Align as RichAlign
 
 # ANSI color codes
 COLORS = {
@@ -71,6 +79,19 @@ COLORS = {
     "bg_bright_white": "\033[107m",
 }
 
+_RESET = COLORS["reset"]
+
+
+def _stdout_isatty() -> bool:
+    """Whether stdout is a terminal; False when there is no stdout (pythonw)."""
+    return getattr(sys.stdout, "isatty", lambda: False)()
+
+
+# Color support, detected once at import (see OutputFormatter.refresh_tty)
+_IS_TTY = _stdout_isatty()
+_NO_COLOR = bool(os.environ.get("NO_COLOR"))
+_FORCE_COLOR = bool(os.environ.get("FORCE_COLOR"))
+
 # Emojis for visual feedback
 EMOJIS = {
     "success": "✓",
@@ -93,12 +114,12 @@ EMOJIS = {
 }
 
 # Box styles for gradient panels
-BOX_STYLES = {
+BOX_STYLES = types.MappingProxyType({
     "rounded": ROUNDED,
     "heavy": HEAVY,
     "ascii": ASCII,
     "double": DOUBLE,
-}
+})
 
 # Predefined gradient color palettes
 GRADIENT_PALETTES = {
@@ -136,11 +157,145 @@ GRADIENT_PALETTES = {
     "info": ["#2F80ED", "#56CCF2"],
 }
 
-# Global console for rich-gradient
-_console = Console()
+# Palettes are read-only: freeze them as shared tuples of interned strings
+GRADIENT_PALETTES = {
+    name: tuple(sys.intern(color) for color in colors)
+    for name, colors in GRADIENT_PALETTES.items()
+}
+
+
+def _resolve_palette(name: str, default: str = "sunset") -> tuple[str, ...]:
+    """Look up a gradient palette by name, falling back to ``default``.
+    
+    Not cached by name: palettes added to GRADIENT_PALETTES later must be
+    picked up. Caches downstream key on the returned color tuple instead.
+    """
+    return tuple(GRADIENT_PALETTES.get(name, GRADIENT_PALETTES[default]))
+
+
+def _runlength_colorize(text: str, indices: Iterable[int], colors: Sequence[str]) -> str:
+    """Render text as Rich markup with one tag per run of identical colors.
+    
+    Args:
+        text: The text to color
+        indices: Color index for each character of text
+        colors: Colors referenced by the indices
+    
+    Returns:
+        Markup string such as ``[#F00]ab[/][#0F0]c[/]``
+    """
+    return "".join([
+        f"[{color}]{''.join(char for _, char in run)}[/]"
+        for color, run in itertools.groupby(
+            zip((colors[k] for k in indices), text), key=lambda pair: pair[0]
+        )
+    ])
+
 
+def _gradient_markup(text: str, colors: Sequence[str]) -> str:
+    """Spread colors evenly over text as Rich markup, one tag per color run.
+    
+    Character ``i`` gets ``colors[(i * len(colors)) // len(text)]``, so each
+    color covers one contiguous slice whose bounds are computed directly
+    instead of per character.
+    """
+    char_count = len(text)
+    color_count = len(colors)
+    parts = []
+    run_start = 0
+    for k in range(color_count):
+        # Adjacent segments of the same color share a single tag
+        if k + 1 < color_count and colors[k + 1] == colors[k]:
+            continue
+        end = -(-(k + 1) * char_count // color_count)
+        if run_start < end:
+            parts.append(f"[{colors[k]}]{text[run_start:end]}[/]")
+        run_start = end
+    return "".join(parts)
+
+
+# JSON tokens for json_pretty: strings, numbers, literals
+_JSON_TOKENS = re.compile(
+    r'("(?:\\.|[^"\\])*")|(-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)|\b(true|false|null)\b'
+)
+_JSON_LITERAL_COLORS = {"true": "bright_magenta", "false": "bright_magenta", "null": "dim"}
+
+
+def _colorize_json_token(match: re.Match) -> str:
+    """Wrap a matched JSON token in its color escape."""
+    string, number, literal = match.groups()
+    if string is not None:
+        color = COLORS["green"]
+    elif number is not None:
+        color = COLORS["cyan"]
+    else:
+        color = COLORS[_JSON_LITERAL_COLORS[literal]]
+    return f"{color}{match.group(0)}{_RESET}"
+
+
+@functools.lru_cache(maxsize=128)
+def _highlight_pattern(words: tuple[str, ...]) -> re.Pattern:
+    """Compile one alternation for a set of keywords, longest first."""
+    ordered = sorted((w for w in set(words) if w), key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, ordered)))
+
+
+# Global console for rich-gradient, created on first use
+_console_holder: list[Optional[Console]] = [None]
+
+
+def _get_console() -> Console:
+    """Return the shared console, constructing it lazily."""
+    if _console_holder[0] is None:
+        # Gradient output never benefits from Rich's repr highlighting regexes,
+        # and no output here uses :emoji: codes
+        _console_holder[0] = Console(highlight=False, markup=True, emoji=False)
+    return _console_holder[0]
+
+
+# Terminal width cache, invalidated after a short TTL or on SIGWINCH
+_WIDTH_TTL = 0.1
+_WIDTH_CACHE = {"w": None, "t": 0.0}
+_resize_handler_installed = [False]
+
+
+def _cached_width() -> int:
+    """Return the console width, re-reading it at most once per TTL."""
+    now = time.monotonic()
+    if _WIDTH_CACHE["w"] is None or now - _WIDTH_CACHE["t"] >= _WIDTH_TTL:
+        _install_resize_handler()
+        _WIDTH_CACHE.update(w=_get_console().width, t=now)
+    return _WIDTH_CACHE["w"]
+
+
+def _install_resize_handler() -> None:
+    """Invalidate the width cache on terminal resize (POSIX only).
+    
+    Installed on first width read rather than at import, and only from the
+    main thread; any handler already in place is still called.
+    """
+    if (
+        _resize_handler_installed[0]
+        or not hasattr(signal, "SIGWINCH")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        return
+    _resize_handler_installed[0] = True
+    previous = signal.getsignal(signal.SIGWINCH)
+    
+    def _on_resize(signum, frame):
+        _WIDTH_CACHE.update(w=None)
+        if callable(previous):
+            previous(signum, frame)
+    
+    try:
+        signal.signal(signal.SIGWINCH, _on_resize)
+    except ValueError:
+        # Signals unavailable here (e.g. embedded interpreter); rely on the TTL
+        pass
 
-class Align:
+
+class TextAlign:
     """Text alignment utilities."""
     
     @staticmethod
@@ -155,12 +310,11 @@ class Align:
         Returns:
             Centered text string
         """
-        width = width or (_console.width - 4)
+        width = width or (_cached_width() - 4)
         if isinstance(text, str):
             return text.center(width, fillchar)
         else:
             # Rich Text object - use Rich's Align
-            from rich.align import Align as RichAlign
             return RichAlign(text, align="center", width=width)
     
     @staticmethod
@@ -175,11 +329,10 @@ class Align:
         Returns:
             Left-aligned text string
         """
-        width = width or (_console.width - 4)
+        width = width or (_cached_width() - 4)
         if isinstance(text, str):
             return text.ljust(width, fillchar)
         else:
-            from rich.align import Align as RichAlign
             return RichAlign(text, align="left", width=width)
     
     @staticmethod
@@ -194,11 +347,10 @@ class Align:
         Returns:
             Right-aligned text string
         """
-        width = width or (_console.width - 4)
+        width = width or (_cached_width() - 4)
         if isinstance(text, str):
             return text.rjust(width, fillchar)
         else:
-            from rich.align import Align as RichAlign
             return RichAlign(text, align="right", width=width)
     
     @staticmethod
@@ -212,18 +364,79 @@ class Align:
         Returns:
             Centered text with newlines
         """
-        width = width or (_console.width - 4)
-        centered = [Align.center(line, width) for line in lines]
+        width = width or (_cached_width() - 4)
+        centered = [TextAlign.center(line, width) for line in lines]
         return "\n".join(centered)
 
 
+class _TickerBus:
+    """Drive every running AnimatedGradientText from one background thread.
+    
+    Each tick renders the animations that are due and then sleeps until the
+    earliest next deadline, so N animations cost one thread instead of N.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._animations: list[AnimatedGradientText] = []
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def register(self, animation: AnimatedGradientText) -> None:
+        """Add an animation and make sure the ticker thread is running."""
+        with self._lock:
+            if animation not in self._animations:
+                self._animations.append(animation)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="gradient-ticker", daemon=True)
+                self._thread.start()
+        self._wake.set()
+    
+    def unregister(self, animation: AnimatedGradientText) -> None:
+        """Remove an animation from the ticker."""
+        with self._lock:
+            if animation in self._animations:
+                self._animations.remove(animation)
+        self._wake.set()
+    
+    def wake(self) -> None:
+        """Re-evaluate animations immediately (e.g. after stop())."""
+        self._wake.set()
+    
+    def _run(self) -> None:
+        try:
+            while True:
+                self._wake.clear()
+                with self._lock:
+                    animations = list(self._animations)
+                    if not animations:
+                        # Exit under the lock so register() starts a fresh thread
+                        self._thread = None
+                        return
+                
+                next_due = float("inf")
+                for animation in animations:
+                    try:
+                        next_due = min(next_due, animation.step(time.monotonic()))
+                    except Exception:
+                        # One broken animation must not stall the others
+                        animation._abort()
+                
+                timeout = None if next_due == float("inf") else max(0.0, next_due - time.monotonic())
+                self._wake.wait(timeout)
+        finally:
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+
 class AnimatedGradientText:
     """Animated gradient text that cycles through colors."""
     
     def __init__(
         self,
         text: str,
-        palette: list[str] = None,
+        palette: Optional[Sequence[str]] = None,
         interval: float = 0.15,
         iterations: int = 0,  # 0 = infinite
     ):
@@ -231,48 +444,84 @@ class AnimatedGradientText:
         self.colors = palette or GRADIENT_PALETTES["neon"]
         self.interval = interval
         self.iterations = iterations
-        self._running = False
-        self._stop_event = threading.Event()
+        self.registered = False
+        self._callback: Callable[..., None] = print
+        self._iteration = 0
+        self._idx = 0
+        self._started = 0.0
+        self._next_due = 0.0
+        self._done = threading.Event()
     
-    def _animate(self, callback: Callable[[str], None]):
-        """Animation loop."""
-        iteration = 0
-        idx = 0
+    def step(self, now: float) -> float:
+        """Render the next frame if it is due; called by the ticker thread.
         
-        while not self._stop_event.is_set():
-            if self.iterations > 0 and iteration >= self.iterations:
-                break
-            
-            colors = self.colors
-            result = ""
-            char_count = len(self.text)
-            color_count = len(colors)
-            
-            for i, char in enumerate(self.text):
-                color_idx = (idx + i) % color_count
-                result += f"[{colors[color_idx]}]{char}[/]"
-            
-            callback(f"\r{result}", end="", flush=True)
-            idx = (idx + 1) % color_count
-            iteration += 1
-            time.sleep(self.interval)
+        Args:
+            now: Current time.monotonic() value
+        
+        Returns:
+            The monotonic time at which this animation next needs a step
+            (infinity once it has finished)
+        """
+        if not self.registered or (self.iterations > 0 and self._iteration >= self.iterations):
+            self._finish()
+            return float("inf")
+        if now < self._next_due:
+            return self._next_due
+        
+        colors = self.colors
+        color_count = len(colors)
+        
+        indices = [(self._idx + i) % color_count for i in range(len(self.text))]
+        result = _runlength_colorize(self.text, indices, colors)
         
-        # Clear the line
-        callback("\r" + " " * 80 + "\r")
-    
-    def start(self, callback: Callable[[str], None] = None):
-        """Start the animation."""
-        self._stop_event.clear()
-        self._running = True
-        callback = callback or print
-        thread = threading.Thread(target=self._animate, args=(callback,), daemon=True)
-        thread.start()
-        return thread
+        self._callback(f"\r{result}", end="", flush=True)
+        self._idx = (self._idx + 1) % color_count
+        self._iteration += 1
+        # Fixed cadence from the start time, so render time never accumulates as drift
+        self._next_due = self._started + self._iteration * self.interval
+        return self._next_due
+    
+    def _finish(self) -> None:
+        self.registered = False
+        _TICKER.unregister(self)
+        if not self._done.is_set():
+            # Clear the line
+            self._callback("\r" + " " * 80 + "\r")
+            self._done.set()
+    
+    def _abort(self) -> None:
+        """End the animation after a failed frame, without touching the line."""
+        self.registered = False
+        _TICKER.unregister(self)
+        self._done.set()
+    
+    def start(self, callback: Callable[[str], None] = None) -> AnimatedGradientText:
+        """Start the animation on the shared ticker.
+        
+        Returns:
+            This animation; call join() to wait for a finite animation
+        """
+        self._callback = callback or print
+        self._iteration = 0
+        self._idx = 0
+        self._started = time.monotonic()
+        self._next_due = self._started
+        self._done.clear()
+        self.registered = True
+        _TICKER.register(self)
+        return self
     
     def stop(self):
         """Stop the animation."""
-        self._stop_event.set()
-        self._running = False
+        self.registered = False
+        _TICKER.wake()
+    
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the animation has finished and cleared its line."""
+        return self._done.wait(timeout)
+
+
+_TICKER = _TickerBus()
 
 
 class GradientRule:
@@ -281,7 +530,7 @@ class GradientRule:
     @staticmethod
     def create(
         text: str = "",
-        colors: list[str] = None,
+        colors: Optional[Sequence[str]] = None,
         width: int = None,
         align: str = "center",
         style: str = "rounded",
@@ -299,7 +548,7 @@ class GradientRule:
             A Rich Rule object with gradient
         """
         colors = colors or GRADIENT_PALETTES["sunset"]
-        width = width or _console.width
+        width = width or _cached_width()
         
         if text:
             rule = Rule(text, align=align, style="cyan")
@@ -311,7 +560,7 @@ class GradientRule:
     @staticmethod
     def gradient_line(
         length: int = 50,
-        colors: list[str] = None,
+        colors: Optional[Sequence[str]] = None,
         direction: str = "horizontal",
     ) -> str:
         """Create a gradient line string.
@@ -329,29 +578,127 @@ class GradientRule:
         if direction == "horizontal":
             segments = len(colors)
             seg_len = length // segments
-            result = ""
-            
-            for i, color in enumerate(colors):
-                is_last = i == segments - 1
-                seg_l = seg_len + (length % segments if is_last else 0)
-                result += f"[{color}]{'─' * seg_l}[/]"
+            remainder = length % segments
             
-            return result
+            parts = [
+                f"[{color}]{'─' * (seg_len + (remainder if i == segments - 1 else 0))}[/]"
+                for i, color in enumerate(colors)
+            ]
+            return "".join(parts)
         else:
             return '\n'.join([f"[{color}]│[/]" for color in colors for _ in range(length // len(colors))])
 
 
+_DEFAULT_BLOCK_COLORS = ("cyan", "blue", "magenta")
+
+
+def _bg_code(color: str) -> str:
+    return COLORS.get(f"bg_{color}", COLORS.get(color, ""))
+
+
+@functools.lru_cache(maxsize=128)
+def _block_cached(width: int, height: int, color: str, use_colors: bool) -> str:
+    """Build (and memoize) the string for OutputFormatter.block."""
+    row = _block_line_cached(width, color, use_colors)
+    return "\n".join([row] * height)
+
+
+@functools.lru_cache(maxsize=128)
+def _block_line_cached(width: int, color: str, use_colors: bool) -> str:
+    """Build (and memoize) the string for OutputFormatter.block_line."""
+    if not use_colors:
+        return " " * width
+    return f"{_bg_code(color)}{' ' * width}{_RESET}"
+
+
+@functools.lru_cache(maxsize=128)
+def _gradient_block_cached(width: int, colors: tuple[str, ...], use_colors: bool) -> str:
+    """Build (and memoize) the string for OutputFormatter.gradient_block."""
+    if not use_colors:
+        return " " * width
+    
+    segments = len(colors)
+    seg_width = width // segments
+    remainder = width % segments
+    parts = [
+        f"{_bg_code(color)}{' ' * (seg_width + (remainder if i == segments - 1 else 0))}"
+        for i, color in enumerate(colors)
+    ]
+    parts.append(_RESET)
+    return "".join(parts)
+
+
 class OutputFormatter:
     """Rich output formatter with colors and styling."""
     
     def __init__(self, use_colors: bool = True):
-        self.use_colors = use_colors and sys.stdout.isatty()
+        # An explicit use_colors=False always wins; FORCE_COLOR only overrides detection
+        self.use_colors = use_colors and ((_IS_TTY and not _NO_COLOR) or _FORCE_COLOR)
     
-    def _color(self, color: str, text: str = "") -> str:
+    @classmethod
+    def refresh_tty(cls) -> None:
+        """Re-detect TTY and NO_COLOR/FORCE_COLOR (e.g. after replacing stdout).
+        
+        Only affects formatters created afterwards.
+        """
+        global _IS_TTY, _NO_COLOR, _FORCE_COLOR
+        _IS_TTY = _stdout_isatty()
+        _NO_COLOR = bool(os.environ.get("NO_COLOR"))
+        _FORCE_COLOR = bool(os.environ.get("FORCE_COLOR"))
+    
+    @property
+    def use_colors(self) -> bool:
+        return self._use_colors
+    
+    @use_colors.setter
+    def use_colors(self, value: bool) -> None:
+        # Bind the color hot path once so _color() never branches per call
+        self._use_colors = value
+        self._color = self._color_on if value else self._color_off
+    
+    def _color_on(self, color: str, text: str = "") -> str:
         """Apply color to text."""
+        try:
+            return f"{COLORS[color]}{text}{_RESET}"
+        except KeyError:
+            return f"{_RESET}{text}{_RESET}"
+    
+    def _color_off(self, color: str, text: str = "") -> str:
+        """Return text unchanged (colors disabled)."""
+        return text
+    
+    def _compose(self, segments: list[tuple[Optional[str], str]]) -> str:
+        """Join (color, text) segments, emitting escapes only on color changes.
+        
+        Adjacent segments sharing a color are concatenated without any escape
+        in between, and a single reset is emitted when leaving a colored run
+        and at the end. A color of None means the default terminal style.
+        
+        Args:
+            segments: List of (color name or None, text) pairs
+        
+        Returns:
+            The composed string
+        """
         if not self.use_colors:
-            return text
-        return f"{COLORS.get(color, COLORS['reset'])}{text}{COLORS['reset']}"
+            return "".join(text for _, text in segments)
+        
+        reset = _RESET
+        parts = []
+        current = None
+        for color, text in segments:
+            if not text:
+                continue
+            if color != current:
+                if current is not None:
+                    parts.append(reset)
+                if color is not None:
+                    parts.append(COLORS.get(color, reset))
+                current = color
+            parts.append(text)
+        if current is not None:
+            parts.append(reset)
+        return "".join(parts)
     
     def block(self, width: int = 1, height: int = 1, color: str = "reset", force_color: bool = False) -> str:
         """Create a colored block with specific width and height.
@@ -365,13 +712,7 @@ class OutputFormatter:
         Returns:
             A string representing a colored block
         """
-        if not self.use_colors and not force_color:
-            return " " * width * height
-        char = " "
-        bg = COLORS.get(f"bg_{color}", COLORS.get(color, ""))
-        reset = COLORS.get("reset", "\033[0m")
-        line = f"{bg}{char * width}{reset}"
-        return line * height
+        return _block_cached(width, height, color, self.use_colors or force_color)
     
     def block_line(self, width: int, color: str = "reset", force_color: bool = False) -> str:
         """Create a single line colored block.
@@ -384,13 +725,9 @@ class OutputFormatter:
         Returns:
             A string representing a colored line block
         """
-        if not self.use_colors and not force_color:
-            return " " * width
-        bg = COLORS.get(f"bg_{color}", COLORS.get(color, ""))
-        reset = COLORS.get("reset", "\033[0m")
-        return f"{bg}{' ' * width}{reset}"
+        return _block_line_cached(width, color, self.use_colors or force_color)
     
-    def gradient_block(self, width: int, colors: list[str] = None) -> str:
+    def gradient_block(self, width: int, colors: Optional[Sequence[str]] = None) -> str:
         """Create a horizontal gradient block.
         
         Args:
@@ -400,23 +737,7 @@ class OutputFormatter:
         Returns:
             A string representing a gradient block
         """
-        if colors is None:
-            colors = ["cyan", "blue", "magenta"]
-        if not self.use_colors:
-            return " " * width
-        
-        segments = len(colors)
-        seg_width = width // segments
-        result = ""
-        reset = COLORS.get("reset", "\033[0m")
-        
-        for i, color in enumerate(colors):
-            is_last = i == segments - 1
-            seg_w = seg_width + (width % segments if is_last else 0)
-            bg = COLORS.get(f"bg_{color}", COLORS.get(color, ""))
-            result += f"{bg}{' ' * seg_w}"
-        
-        return f"{result}{reset}"
+        return _gradient_block_cached(width, tuple(colors or _DEFAULT_BLOCK_COLORS), self.use_colors)
     
     def _style(self, style: str, text: str) -> str:
         """Apply style to text."""
@@ -433,11 +754,23 @@ class OutputFormatter:
     def title(self, text: str) -> str:
         """Display a title."""
         line = "=" * (len(text) + 4)
-        return f"\n{self._color('bright_cyan', line)}\n{self._color('bright_cyan', '│ ')}{self._color('bold', text)}{self._color('bright_cyan', ' │')}\n{self._color('bright_cyan', line)}\n"
+        return self._compose([
+            (None, "\n"),
+            ("bright_cyan", f"{line}\n│ "),
+            ("bold", text),
+            ("bright_cyan", f" │\n{line}"),
+            (None, "\n"),
+        ])
     
     def header(self, text: str) -> str:
         """Display a section header."""
-        return f"\n{self._color('bright_blue', '▶')} {self._color('bold', text)}\n"
+        return self._compose([
+            (None, "\n"),
+            ("bright_blue", "▶"),
+            (None, " "),
+            ("bold", text),
+            (None, "\n"),
+        ])
     
     def success(self, text: str) -> str:
         """Display success message."""
@@ -461,7 +794,12 @@ class OutputFormatter:
     
     def metric(self, label: str, value: Any, unit: str = "") -> str:
         """Display a metric."""
-        return f"{self._color('cyan', label)}: {self._color('bright_white', str(value))} {unit}"
+        return self._compose([
+            ("cyan", label),
+            (None, ": "),
+            ("bright_white", str(value)),
+            (None, f" {unit}"),
+        ])
     
     def timestamp(self, dt: datetime) -> str:
         """Display formatted timestamp."""
@@ -473,26 +811,7 @@ class OutputFormatter:
         if not self.use_colors:
             return json_str
         
-        # Simple syntax highlighting for JSON
-        result = []
-        in_string = False
-        for i, char in enumerate(json_str):
-            if char == '"' and (i == 0 or json_str[i-1] != '\\'):
-                in_string = not in_string
-                result.append(COLORS['green'])
-                result.append(char)
-                result.append(COLORS['reset'])
-            elif in_string:
-                result.append(char)
-            elif json_str[i:i+5] in ['true', 'fals']:
-                result.append(COLORS['bright_magenta'])
-                result.append(char)
-                result.append(COLORS['reset'])
-            elif json_str[i:i+4] == 'null':
-                result.append(COLORS['dim'])
-            else:
-                result.append(char)
-        return ''.join(result)
+        return _JSON_TOKENS.sub(_colorize_json_token, json_str)
     
     def divider(self, char: str = "─", length: int = 50) -> str:
         """Display a divider line."""
@@ -507,33 +826,51 @@ class OutputFormatter:
     ) -> str:
         """Display text in a box."""
         lines = text.split('\n')
-        max_len = max(len(line) for line in lines)
+        max_len = max(map(len, lines))
         box_width = max_len + (padding[1] * 2) + 2
         
-        top = self._color(border_color, "┌" + "─" * (box_width - 2) + "┐")
-        bottom = self._color(border_color, "└" + "─" * (box_width - 2) + "┘")
+        prefix = COLORS.get(border_color, _RESET) if self.use_colors else ""
+        suffix = _RESET if self.use_colors else ""
+        top = "┌" + "─" * (box_width - 2) + "┐"
+        bottom = "└" + "─" * (box_width - 2) + "┘"
         
-        content = []
-        for line in lines:
-            padded = " " * padding[1] + line + " " * (max_len - len(line) + padding[1])
-            content.append(self._color(border_color, "│") + padded + self._color(border_color, "│"))
+        # Borders on consecutive lines share one colored run across the newline
+        pad = " " * padding[1]
+        content = [f"{pad}{line}{' ' * (max_len - len(line))}{pad}" for line in lines]
         
         if title:
             title_line = f" {title} "
             title_padding = "─" * ((box_width - len(title_line) - 2) // 2)
-            title_bar = self._color(border_color, f"├{title_padding}{title_line}{title_padding}┤")
+            title_bar = f"{prefix}├{title_padding}{title_line}{title_padding}┤{suffix}"
         
-        result = [top] + content + [bottom]
-        return '\n'.join(result)
+        return "".join([
+            f"{prefix}{top}\n│{suffix}",
+            f"{prefix}│\n│{suffix}".join(content),
+            f"{prefix}│\n{bottom}{suffix}",
+        ])
     
     def list_item(self, bullet: str, text: str, indent: int = 0) -> str:
         """Display a list item."""
         prefix = "  " * indent
-        return f"{prefix}{self._color('bright_blue', bullet)} {text}"
+        return self._compose([(None, prefix), ("bright_blue", bullet), (None, f" {text}")])
     
-    def highlight(self, text: str, highlight: str) -> str:
-        """Highlight specific text."""
-        return text.replace(highlight, self._color('bright_yellow', highlight))
+    def highlight(self, text: str, highlight: Union[str, Iterable[str]]) -> str:
+        """Highlight specific text.
+        
+        Args:
+            text: The text to search
+            highlight: A substring, or several substrings matched in one pass
+        
+        Returns:
+            The text with every match highlighted
+        """
+        if isinstance(highlight, str):
+            return text.replace(highlight, self._color('bright_yellow', highlight))
+        words = tuple(highlight)
+        if not any(words):
+            return text
+        pattern = _highlight_pattern(words)
+        return pattern.sub(lambda m: self._color('bright_yellow', m.group(0)), text)
     
     def gradient_title(
             self, 
@@ -554,7 +891,7 @@ class OutputFormatter:
             animated: Whether to show animated dots
             padding: Padding (top, bottom)
         """
-        colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["sunset"])
+        colors = _resolve_palette(palette, "sunset")
         
         # Create animated inline_text if requested
         if animated:
@@ -571,7 +908,7 @@ class OutputFormatter:
             padding=padding,
             expand=True,
         )
-        _console.print(Align.center(panel))
+        _get_console().print(RichAlign.center(panel))
     
     def gradient_panel(
         self, 
@@ -594,7 +931,7 @@ class OutputFormatter:
             animated: Whether to use animated panel
             padding: Padding inside the box
         """
-        colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["sunset"])
+        colors = _resolve_palette(palette, "sunset")
         box = BOX_STYLES.get(box_style, ROUNDED)
         
         if animated:
@@ -618,7 +955,7 @@ class OutputFormatter:
                 padding=padding,
                 expand=True,
             )
-        _console.print(Align.center(panel))
+        _get_console().print(RichAlign.center(panel))
     
     def gradient_text(self, text: str, palette: str = "ocean") -> str:
         """Create gradient text.
@@ -630,7 +967,7 @@ class OutputFormatter:
         Returns:
             Gradient renderable
         """
-        colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["ocean"])
+        colors = _resolve_palette(palette, "ocean")
         return Gradient(text, colors=colors)
     
     def print_gradient(self, text: str, palette: str = "neon") -> None:
@@ -640,9 +977,9 @@ class OutputFormatter:
             text: The text to display
             palette: Name of gradient palette to use
         """
-        colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["neon"])
+        colors = _resolve_palette(palette, "neon")
         gradient = Gradient(text, colors=colors)
-        _console.print(gradient)
+        _get_console().print(gradient)
     
     def print_animated_gradient(
         self, 
@@ -659,7 +996,7 @@ class OutputFormatter:
             iterations: Number of iterations (0 = infinite)
             interval: Animation speed in seconds
         """
-        colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["neon"])
+        colors = _resolve_palette(palette, "neon")
         animated = AnimatedGradientText(
             text=text,
             palette=colors,
@@ -667,15 +1004,17 @@ class OutputFormatter:
             interval=interval,
         )
         
-        def callback(output: str, **kwargs):
-            _console.print(output, **kwargs)
+        def callback(output: str, end: str = "\n", flush: bool = False):
+            # Console.print() has no flush argument; it writes through on its own
+            _get_console().print(output, end=end)
         
         animated.start(callback)
         
-        # If finite iterations, wait for completion
-        if iterations > 0:
-            time.sleep(iterations * interval * len(colors) / 10)
+        # If finite iterations, wait for the animation to finish, but never
+        # much longer than it should take
+        if iterations > 0 and not animated.join(timeout=iterations * interval + 1.0):
             animated.stop()
+            animated.join(timeout=1.0)
     
     def print_gradient_rule(
         self,
@@ -689,27 +1028,29 @@ class OutputFormatter:
         Args:
             text: Text to display in the rule (optional)
             palette: Name of gradient palette to use
-            width: Width of the rule
+            width: Unused; the rule always spans the console width
+            align: Text alignment ('left', 'center', 'right')
+        """
+        _get_console().print(self.gradient_rule(text, palette, align))
+    
+    def gradient_rule(self, text: str = "", palette: str = "sunset", align: str = "center") -> Rule:
+        """Create a gradient rule/separator line without printing it.
+        
+        Args:
+            text: Text to display in the rule (optional)
+            palette: Name of gradient palette to use
             align: Text alignment ('left', 'center', 'right')
+        
+        Returns:
+            A Rich Rule renderable
         """
-        colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["sunset"])
-        width = width or _console.width - 4
+        colors = _resolve_palette(palette, "sunset")
         
         if text:
             # Create gradient text for the rule
-            gradient_text = ""
-            char_count = len(text)
-            color_count = len(colors)
-            
-            for i, char in enumerate(text):
-                color_idx = (i * color_count) // char_count
-                gradient_text += f"[{colors[color_idx]}]{char}[/]"
-            
-            rule = Rule(gradient_text, align=align, style=colors[0])
-        else:
-            rule = Rule(style=colors[0])
-        
-        _console.print(rule)
+            gradient_text = _gradient_markup(text, colors)
+            return Rule(gradient_text, align=align, style=colors[0])
+        return Rule(style=colors[0])
     
     def print_gradient_box(
         self,
@@ -730,7 +1071,7 @@ class OutputFormatter:
             box_style: Box style ('rounded', 'heavy', 'ascii', 'double')
             padding: Padding inside the box
         """
-        colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["sunset"])
+        colors = _resolve_palette(palette, "sunset")
         box = BOX_STYLES.get(box_style, ROUNDED)
         
         # Create a simple panel with gradient border
@@ -742,7 +1083,7 @@ class OutputFormatter:
             box=box,
             padding=padding,
         )
-        _console.print(Align.center(panel))
+        _get_console().print(RichAlign.center(panel))
     
     def print_centered_box(
         self,
@@ -763,7 +1104,27 @@ class OutputFormatter:
             box_style: Box style ('rounded', 'heavy', 'ascii', 'double')
             padding: Padding inside the box
         """
-        colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["sunset"])
+        _get_console().print(
+            self.centered_box(inline_text, title, subtitle, palette, box_style, padding)
+        )
+    
+    def centered_box(
+        self,
+        inline_text: str,
+        title: str,
+        subtitle: str = "",
+        palette: str = "sunset",
+        box_style: str = "rounded",
+        padding: Optional[tuple[int, int]] = (1, 2),
+    ) -> RichAlign:
+        """Create a centered gradient box without printing it.
+        
+        Takes the same arguments as print_centered_box.
+        
+        Returns:
+            A centered Rich renderable
+        """
+        colors = _resolve_palette(palette, "sunset")
         box = BOX_STYLES.get(box_style, ROUNDED)
         
         # Format content with centered text
@@ -780,46 +1141,76 @@ class OutputFormatter:
             box=box,
             padding=padding,
         )
-        _console.print(Align.center(panel))
+        return RichAlign.center(panel)
 
 
 # Global formatter instance
 formatter = OutputFormatter()
 
+# Target stream for the print_* helpers (None = current sys.stdout)
+_OUT: Optional[TextIO] = None
+
+
+def _write_batch(*parts: str) -> None:
+    """Write all parts with a single write() and one flush."""
+    out = _OUT or sys.stdout
+    out.write("".join(parts))
+    out.flush()
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """Buffer print_* helper output and emit it as one write on exit.
+    
+    Example:
+        with batch():
+            for item in items:
+                print_info(item)
+    """
+    global _OUT
+    previous = _OUT
+    buffer = io.StringIO()
+    _OUT = buffer
+    try:
+        yield
+    finally:
+        _OUT = previous
+        _write_batch(buffer.getvalue())
+
 
 def print_title(text: str):
     """Print a title."""
-    print(formatter.title(text))
+    _write_batch(formatter.title(text), "\n")
 
 
 def print_header(text: str):
     """Print a section header."""
-    print(formatter.header(text))
+    _write_batch(formatter.header(text), "\n")
 
 
 def print_success(text: str):
     """Print a success message."""
-    print(formatter.success(text))
+    _write_batch(formatter.success(text), "\n")
 
 
 def print_error(text: str):
     """Print an error message."""
-    print(formatter.error(text))
+    _write_batch(formatter.error(text), "\n")
 
 
 def print_warning(text: str):
     """Print a warning message."""
-    print(formatter.warning(text))
+    _write_batch(formatter.warning(text), "\n")
 
 
 def print_info(text: str):
     """Print an info message."""
-    print(formatter.info(text))
+    _write_batch(formatter.info(text), "\n")
 
 
 def print_thinking(text: str):
     """Print a thinking indicator."""
-    print(formatter.thinking(text))
+    _write_batch(formatter.thinking(text), "\n")
 
 
 def print_gradient_title(
@@ -985,7 +1376,30 @@ def print_centered_box(
     )
 
 
-def apply_gradient(text: str, colors: list[str], bold: bool = True) -> Text:
+@functools.lru_cache(maxsize=4096)
+def _gradient_indices(length: int, ncolors: int) -> tuple[int, ...]:
+    """Color index for each of ``length`` characters spread over ``ncolors``."""
+    ncolors_minus_one = ncolors - 1
+    return tuple((i * ncolors_minus_one) // length for i in range(length))
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_gradient_text(text: str, colors: tuple[str, ...], bold: bool) -> Text:
+    gradient_text = Text()
+    styles = [f"bold {color}" if bold else color for color in colors]
+    append = gradient_text.append
+    
+    # One append per run of characters sharing a color, not one per character
+    start = 0
+    for color_index, run in itertools.groupby(_gradient_indices(max(len(text), 1), len(colors))[:len(text)]):
+        end = start + sum(1 for _ in run)
+        append(text[start:end], style=styles[color_index])
+        start = end
+    
+    return gradient_text
+
+
+def apply_gradient(text: str, colors: Sequence[str], bold: bool = True) -> Text:
     """Apply gradient colors to text.
     
     Args:
@@ -996,24 +1410,23 @@ def apply_gradient(text: str, colors: list[str], bold: bool = True) -> Text:
     Returns:
         Rich Text object with gradient styling
     """
-    gradient_text = Text()
-    length = max(len(text), 1)
-    
-    for i, char in enumerate(text):
-        color_index = int(i / length * (len(colors) - 1))
-        style = f"bold {colors[color_index]}" if bold else colors[color_index]
-        gradient_text.append(char, style=style)
-    
-    return gradient_text
+    # Copy so callers can modify the result without touching the cache
+    return _cached_gradient_text(text, tuple(colors), bold).copy()
+
+@functools.lru_cache(maxsize=64)
+def _gradient_line_styles(length: int, colors: tuple[str, ...]) -> tuple[str, ...]:
+    """Per-character styles for a gradient line; width rarely changes in a session."""
+    styles = [f"color({color})" for color in colors]
+    return tuple(styles[i] for i in _gradient_indices(length, len(colors)))
+
 
 def build_gradient_line(width: int, palette: str = "ocean") -> Text:
-    colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["ocean"])
     line = Text()
-    length = max(width, 1)
+    line_append = line.append
 
-    for i in range(length):
-        color_index = int(i / length * (len(colors) - 1))
-        line.append("─", style=f"color({colors[color_index]})")
+    colors = _resolve_palette(palette, "ocean")
+    for style in _gradient_line_styles(max(width, 1), colors):
+        line_append("─", style=style)
 
     return line
 
@@ -1022,25 +1435,29 @@ def print_gradient_inline_multiple_text_with_rows(
     sep: str = "   ",
     separator_palette: str = "ocean",
 ):
-    # 1️⃣ Calculate max column widths
-    col_count = max(len(row) for row in rows)
-    col_widths = [0] * col_count
-
-    for row in rows:
-        for i, (text, _) in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(text))
+    # 1️⃣ Calculate max column widths in a single pass over the columns
+    col_widths = [
+        max((len(text) for text, _ in col), default=0)
+        for col in itertools.zip_longest(*rows, fillvalue=("", None))
+    ]
 
     rendered_lines = []
+    palette_colors = {}
+    pad_cache = {}
 
     # 2️⃣ Build aligned rows
     for irow, row in enumerate(rows):
         line = Text()
 
         for i, (text, palette) in enumerate(row):
-            padded = text.center(col_widths[i])
+            padded = pad_cache.get((text, col_widths[i]))
+            if padded is None:
+                padded = pad_cache[text, col_widths[i]] = text.center(col_widths[i])
 
             if palette:
-                colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["neon"])
+                colors = palette_colors.get(palette)
+                if colors is None:
+                    colors = palette_colors[palette] = _resolve_palette(palette, "neon")
                 line.append(apply_gradient(padded, colors))
             else:
                 line.append(padded)
@@ -1057,14 +1474,39 @@ def print_gradient_inline_multiple_text_with_rows(
                 build_gradient_line(block_width, separator_palette)
             )
 
-    # 4️⃣ Center entire block
-    for line in rendered_lines:
-        _console.print(Align.center(line))
+    # 4️⃣ Center entire block and emit it with a single print
+    _get_console().print(Group(*[TextAlign.center(line) for line in rendered_lines]), markup=False)
 
 
 # Gradient Rule
 gradient_with_rule = GradientRule()
 
+
+def _segment_markup(text: str, colors: Sequence[str], n_colors: int) -> str:
+    """Split text into contiguous color segments for print_gradient_with_rule.
+    
+    n_colors = 1 uses the first color, 2 splits the text in half between the
+    first and last colors, and 3+ spreads n_colors - 1 equal segments over
+    the palette (-1 means one segment per palette color).
+    """
+    if not text:
+        return ""
+    if n_colors == -1:
+        n_colors = len(colors) + 1
+    n_colors = max(n_colors, 1)
+    
+    if n_colors == 1:
+        return f"[{colors[0]}]{text}[/]"
+    if n_colors == 2:
+        half = -(-len(text) // 2)
+        parts = [f"[{colors[0]}]{text[:half]}[/]"]
+        if text[half:]:
+            parts.append(f"[{colors[-1]}]{text[half:]}[/]")
+        return "".join(parts)
+    
+    last = len(colors) - 1
+    return _gradient_markup(text, [colors[min(k, last)] for k in range(n_colors - 1)])
+
 def print_gradient_with_rule(
     text: str,
     palette: str = "sunset",
@@ -1078,34 +1520,16 @@ def print_gradient_with_rule(
     Args:
         text: The text to display
         palette: Name of gradient palette to use
-        width: Width of the rule
+        width: Unused; the rule always spans the console width
         align: Text alignment ('left', 'center', 'right')
         style: Box style ('rounded', 'heavy', 'ascii', 'double')
         n_colors: Number of colors to use
     """
-    colors = GRADIENT_PALETTES.get(palette, GRADIENT_PALETTES["sunset"])
-    width = width or _console.width - 4
-    
-    # Create gradient text for the rule
-    gradient_text = ""
-    char_count = len(text)
+    colors = _resolve_palette(palette, "sunset")
     
-    for i, char in enumerate(text):
-        color_idx = int(i / char_count * (len(colors) - 1))
-        if n_colors < 1 and n_colors != -1:
-            n_colors = 1
-        if n_colors == -1:
-            n_colors = len(colors) + 1
-        elif n_colors == 1:
-            color_idx = 0
-        elif n_colors == 2:
-            color_idx = 0 if i < char_count / 2 else len(colors) - 1
-        elif n_colors >= 3:
-            segment_length = char_count / (n_colors - 1)
-            color_idx = min(int(i / segment_length), n_colors - 1)
-
-        gradient_text += f"[{colors[color_idx]}]{char}[/]"
+    # Create gradient text for the rule, one markup span per color segment
+    gradient_text = _segment_markup(text, colors, n_colors)
     
     # Print rule with gradient text
     rule = Rule(gradient_text, align=align, style=style)
-    _console.print(rule)
+    _get_console().print(rule)
@@ -6,31 +6,42 @@ Beautiful, colorful interactive selection prompts with smooth UX.
 from __future__ import annotations
 
 import re
+import socket
 import sys
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-import questionary
-from questionary import Choice, Separator, Style as QStyle, text
 
 from rich import print as rprint
-from rich.console import Console
+from rich.console import Console, Group
 
 from .output import (
     GRADIENT_PALETTES,
-    _console,
+    _get_console,
+    _write_batch,
     print_gradient,
-    print_gradient_rule,
     print_gradient_box,
     print_gradient_title,
-    print_centered_box,
     OutputFormatter,
 )
 
+if TYPE_CHECKING:
+    from questionary import Choice, Style as QStyle
+
+
+# Validator patterns, compiled once
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s]+$')
+_HOSTNAME_RE = re.compile(
+    r'^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9])\.)*([A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9\-]*[A-Za-z0-9])$'
+)
+_IP_RE = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+
 
 class ValidationStatus(Enum):
     VALID = "valid"
@@ -38,97 +49,126 @@ class ValidationStatus(Enum):
     WARNING = "warning"
 
 
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
-    def __init__(self, status: ValidationStatus, message: str, hint: str = None):
-        self.status = status
-        self.message = message
-        self.hint = hint
+    # Frozen: Validators hands out shared instances
+    status: ValidationStatus
+    message: str
+    hint: Optional[str] = None
     
     def is_valid(self):
         return self.status == ValidationStatus.VALID
 
 
 class Validators:
+    # Shared results for validators whose messages never vary
+    _EMAIL_OK = ValidationResult(ValidationStatus.VALID, "Valid email")
+    _EMAIL_BAD = ValidationResult(ValidationStatus.INVALID, "Invalid email")
+    _URL_OK = ValidationResult(ValidationStatus.VALID, "Valid URL")
+    _URL_BAD = ValidationResult(ValidationStatus.INVALID, "Invalid URL")
+    _PATH_OK = ValidationResult(ValidationStatus.VALID, "Path exists")
+    _PATH_BAD = ValidationResult(ValidationStatus.INVALID, "Path not found")
+    _NOT_EMPTY_OK = ValidationResult(ValidationStatus.VALID, "Value provided")
+    _NOT_EMPTY_BAD = ValidationResult(ValidationStatus.INVALID, "Cannot be empty")
+    _HOSTNAME_OK = ValidationResult(ValidationStatus.VALID, "Valid hostname")
+    _HOSTNAME_BAD = ValidationResult(ValidationStatus.INVALID, "Invalid hostname")
+    _PORT_RANGE = ValidationResult(ValidationStatus.INVALID, "Port 1-65535")
+    _PORT_BAD = ValidationResult(ValidationStatus.INVALID, "Not a valid port")
+    _IP_OK = ValidationResult(ValidationStatus.VALID, "Valid IP address")
+    _IP_BAD = ValidationResult(ValidationStatus.INVALID, "Invalid IP format")
+    _IP_OCTET = ValidationResult(ValidationStatus.INVALID, "Each octet 0-255")
+    _NOT_A_NUMBER = ValidationResult(ValidationStatus.INVALID, "Not a number")
+    
     @staticmethod
     def email(value: str) -> ValidationResult:
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(pattern, value):
-            return ValidationResult(ValidationStatus.VALID, "Valid email")
-        return ValidationResult(ValidationStatus.INVALID, "Invalid email")
+        if _EMAIL_RE.match(value):
+            return Validators._EMAIL_OK
+        return Validators._EMAIL_BAD
     
     @staticmethod
     def url(value: str) -> ValidationResult:
-        pattern = r'^https?://[^\s]+$'
-        if re.match(pattern, value):
-            return ValidationResult(ValidationStatus.VALID, "Valid URL")
-        return ValidationResult(ValidationStatus.INVALID, "Invalid URL")
+        if _URL_RE.match(value):
+            return Validators._URL_OK
+        return Validators._URL_BAD
     
     @staticmethod
     def path_exists(value: str) -> ValidationResult:
         if Path(value).exists():
-            return ValidationResult(ValidationStatus.VALID, "Path exists")
-        return ValidationResult(ValidationStatus.INVALID, "Path not found")
+            return Validators._PATH_OK
+        return Validators._PATH_BAD
     
     @staticmethod
     def min_length(min_len: int) -> Callable:
+        ok = ValidationResult(ValidationStatus.VALID, f"At least {min_len} chars")
+        bad = ValidationResult(ValidationStatus.INVALID, f"Min {min_len} chars")
+
         def validator(value: str) -> ValidationResult:
-            if len(value) >= min_len:
-                return ValidationResult(ValidationStatus.VALID, f"At least {min_len} chars")
-            return ValidationResult(ValidationStatus.INVALID, f"Min {min_len} chars")
+            return ok if len(value) >= min_len else bad
         return validator
     
     @staticmethod
     def max_length(max_len: int) -> Callable:
+        ok = ValidationResult(ValidationStatus.VALID, f"At most {max_len} chars")
+        bad = ValidationResult(ValidationStatus.INVALID, f"Max {max_len} chars")
+
         def validator(value: str) -> ValidationResult:
-            if len(value) <= max_len:
-                return ValidationResult(ValidationStatus.VALID, f"At most {max_len} chars")
-            return ValidationResult(ValidationStatus.INVALID, f"Max {max_len} chars")
+            return ok if len(value) <= max_len else bad
         return validator
     
     @staticmethod
     def numeric_range(min_val: int, max_val: int) -> Callable:
+        ok = ValidationResult(ValidationStatus.VALID, "In range")
+        bad = ValidationResult(ValidationStatus.INVALID, f"Range: {min_val}-{max_val}")
+
         def validator(value: str) -> ValidationResult:
             try:
                 num = int(value)
-                if min_val <= num <= max_val:
-                    return ValidationResult(ValidationStatus.VALID, f"In range")
-                return ValidationResult(ValidationStatus.INVALID, f"Range: {min_val}-{max_val}")
             except ValueError:
-                return ValidationResult(ValidationStatus.INVALID, "Not a number")
+                return Validators._NOT_A_NUMBER
+            return ok if min_val <= num <= max_val else bad
         return validator
     
     @staticmethod
     def not_empty(value: str) -> ValidationResult:
         if value and value.strip():
-            return ValidationResult(ValidationStatus.VALID, "Value provided")
-        return ValidationResult(ValidationStatus.INVALID, "Cannot be empty")
+            return Validators._NOT_EMPTY_OK
+        return Validators._NOT_EMPTY_BAD
     
     @staticmethod
     def hostname(value: str) -> ValidationResult:
-        pattern = r'^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9])\.)*([A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9\-]*[A-Za-z0-9])$'
-        if re.match(pattern, value) and len(value) <= 255:
-            return ValidationResult(ValidationStatus.VALID, "Valid hostname")
-        return ValidationResult(ValidationStatus.INVALID, "Invalid hostname")
+        if len(value) <= 255 and _HOSTNAME_RE.match(value):
+            return Validators._HOSTNAME_OK
+        return Validators._HOSTNAME_BAD
     
     @staticmethod
     def port(value: str) -> ValidationResult:
-        try:
+        # Plain ASCII digits (the common case) skip the exception machinery
+        if value.isascii() and value.isdigit():
             port = int(value)
-            if 1 <= port <= 65535:
-                return ValidationResult(ValidationStatus.VALID, f"Valid port {port}")
-            return ValidationResult(ValidationStatus.INVALID, "Port 1-65535")
-        except ValueError:
-            return ValidationResult(ValidationStatus.INVALID, "Not a valid port")
+        else:
+            try:
+                port = int(value)
+            except ValueError:
+                return Validators._PORT_BAD
+        if 1 <= port <= 65535:
+            return ValidationResult(ValidationStatus.VALID, f"Valid port {port}")
+        return Validators._PORT_RANGE
     
     @staticmethod
     def ip_address(value: str) -> ValidationResult:
-        pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-        if not re.match(pattern, value):
-            return ValidationResult(ValidationStatus.INVALID, "Invalid IP format")
+        # Canonical dotted quads are validated by a single C call
+        try:
+            socket.inet_pton(socket.AF_INET, value)
+            return Validators._IP_OK
+        except (OSError, ValueError):
+            pass
+        # Slow path keeps accepting leading zeros and reports why it failed
+        if not _IP_RE.match(value):
+            return Validators._IP_BAD
         parts = value.split('.')
         if all(0 <= int(p) <= 255 for p in parts):
-            return ValidationResult(ValidationStatus.VALID, "Valid IP address")
-        return ValidationResult(ValidationStatus.INVALID, "Each octet 0-255")
+            return Validators._IP_OK
+        return Validators._IP_OCTET
 
 
 class PromptTheme:
@@ -170,10 +210,17 @@ class PromptTheme:
         },
     }
     
+    # Per-theme style caches, filled on first use
+    _style_cache: dict = {}
+    _qstyle_cache: dict = {}
+    
     @classmethod
     def get_style(cls, theme: str = "ocean") -> list:
+        cached = cls._style_cache.get(theme)
+        if cached is not None:
+            return list(cached)
         colors = cls.THEMES.get(theme, cls.THEMES["ocean"])
-        return [
+        cls._style_cache[theme] = cached = (
             ("qmark", f"fg:{colors['primary']} bold"),
             ("question", f"fg:{colors['secondary']} bold"),
             ("answer", f"fg:{colors['accent']} bold"),
@@ -184,23 +231,50 @@ class PromptTheme:
             ("instruction", "fg:#888888"),
             ("header", f"fg:{colors['header']} bold"),
             ("footer", "fg:#666666 italic"),
-        ]
+        )
+        return list(cached)
     
     @classmethod
     def get_questionary_style(cls, theme: str = "ocean") -> QStyle:
-        return QStyle(cls.get_style(theme))
+        qstyle = cls._qstyle_cache.get(theme)
+        if qstyle is None:
+            qstyle = cls._qstyle_cache[theme] = _questionary().Style(cls.get_style(theme))
+        return qstyle
     
     @classmethod
     def get_all_themes(cls) -> List[str]:
         return list(cls.THEMES.keys())
 
 
+def _questionary():
+    """Import questionary on first use; it pulls in all of prompt_toolkit."""
+    import questionary
+    return questionary
+
+
+def _first_line(s: Optional[str]) -> str:
+    """Return the first line of ``s`` without splitting the whole string."""
+    return s.partition("\n")[0].rstrip("\r") if s else ""
+
+
+def _prompt_text(message: Optional[str], instruction: Optional[str]) -> str:
+    """Build the "<first line> ◆\n<instruction>" prompt text."""
+    return f"{_first_line(message)} ◆\n{instruction or ''}"
+
+
 class InteractivePrompter:
     def __init__(self, theme: str = "ocean", use_colors: bool = True):
         self.theme = theme
-        self.use_colors = use_colors and sys.stdout.isatty()
-        self.formatter = OutputFormatter(use_colors=self.use_colors)
+        # The formatter resolves TTY / NO_COLOR / FORCE_COLOR once at import
+        self.formatter = OutputFormatter(use_colors=use_colors)
+        self.use_colors = self.formatter.use_colors
         self.colors = PromptTheme.THEMES.get(theme, PromptTheme.THEMES["ocean"])
+        self._choices_cache: dict[tuple, list] = {}
+    
+    @property
+    def _qstyle(self) -> QStyle:
+        # Resolved on first prompt so building a prompter doesn't import questionary
+        return PromptTheme.get_questionary_style(self.theme)
     
     def _print_header(
             self, 
@@ -209,9 +283,11 @@ class InteractivePrompter:
             subtitle: str = None,
             padding: Optional[tuple[int, int]] = (1, 2)
     ) -> None:
-        print_gradient_rule(palette=self.theme, width=_console.width - 4)
-        print()
-        print_centered_box(
+        if not self.use_colors:
+            _write_batch(title or "", "\n", text or "", "\n")
+            return
+        rule = self.formatter.gradient_rule(palette=self.theme)
+        box = self.formatter.centered_box(
             title=title,
             inline_text=text,
             subtitle=subtitle,
@@ -219,13 +295,23 @@ class InteractivePrompter:
             box_style="rounded",
             padding=padding
         )
-        print_gradient_rule(palette=self.theme, width=_console.width - 4)
-        print()
+        # Render rule, blank line, box, rule and trailing blank line off-screen,
+        # then emit the whole header with a single write
+        console = _get_console()
+        with console.capture() as capture:
+            console.print(Group(rule, "", box, rule, ""))
+        _write_batch(capture.get())
     
     def _print_success(self, message: str) -> None:
+        if not self.use_colors:
+            _write_batch(f"✓ {message}\n")
+            return
         print_gradient(f"✓ {message}", palette="success")
     
     def _print_selection(self, selection: str, title: str) -> None:
+        if not self.use_colors:
+            _write_batch(f"▶ Selected: {selection}\n")
+            return
         print_gradient(f"▶ Selected: {selection}", palette=self.theme)
     
     def _handle_cancellation(self, prompt_type: str = "prompt") -> None:
@@ -246,8 +332,9 @@ class InteractivePrompter:
         qmark: str = "◆",
         **kwargs,
     ) -> Any:
+        questionary = _questionary()
         self._print_header(
-            text=f"{message.splitlines()[0] if message else ''} ◆\n{instruction if instruction else ''}", 
+            text=_prompt_text(message, instruction), 
             title=title,
             subtitle=subtitle,
             padding=padding
@@ -256,7 +343,7 @@ class InteractivePrompter:
         styled_choices = []
         for choice in choices:
             if isinstance(choice, str):
-                styled_choices.append(Choice(choice, value=choice, disabled=False))
+                styled_choices.append(questionary.Choice(choice, value=choice, disabled=False))
             else:
                 styled_choices.append(choice)
         
@@ -265,7 +352,7 @@ class InteractivePrompter:
                 message=message,
                 choices=styled_choices,
                 default=default,
-                style=PromptTheme.get_questionary_style(self.theme),
+                style=self._qstyle,
                 qmark=qmark,
                 use_shortcuts=True,
                 use_arrow_keys=True,
@@ -290,7 +377,9 @@ class InteractivePrompter:
         inline_text: str = "Navigate with Arrow Keys | Enter to Select | ESC to Quit",
         subtitle: Optional[str] = None,
         padding: Optional[tuple[int, int]] = (1, 2),
+        rebuild: bool = False,
     ) -> Optional[str]:
+        questionary = _questionary()
         self._print_header(
             text=inline_text,
             title=title, 
@@ -298,23 +387,37 @@ class InteractivePrompter:
             padding=padding
         )
         
-        choices = []
-        for opt in options:
-            if opt.get("separator"):
-                choices.append(Separator(opt["title"]))
-            else:
-                choice = Choice(
-                    title=opt.get("title", opt["id"]),
-                    value=opt["id"],
-                    disabled=opt.get("disabled", False),
-                )
-                choices.append(choice)
+        # Menus reopened in a loop reuse their Choice/Separator objects
+        try:
+            key = tuple(
+                (opt.get("id"), opt.get("title"), opt.get("disabled"), opt.get("separator"))
+                for opt in options
+            )
+            hash(key)
+        except TypeError:
+            key = None
+        
+        choices = None if rebuild or key is None else self._choices_cache.get(key)
+        if choices is None:
+            choices = []
+            for opt in options:
+                if opt.get("separator"):
+                    choices.append(questionary.Separator(opt["title"]))
+                else:
+                    choice = questionary.Choice(
+                        title=opt.get("title", opt["id"]),
+                        value=opt["id"],
+                        disabled=opt.get("disabled", False),
+                    )
+                    choices.append(choice)
+            if key is not None:
+                self._choices_cache[key] = choices
         
         try:
             return questionary.select(
                 message=f"{title}:",
                 choices=choices,
-                style=PromptTheme.get_questionary_style(self.theme),
+                style=self._qstyle,
                 qmark="◆",
                 pointer="▶",
             ).ask()
@@ -334,8 +437,9 @@ class InteractivePrompter:
         instruction: str = "Press Y for Yes, N for No, Enter to confirm",
         **kwargs,
     ) -> Optional[bool]:
+        questionary = _questionary()
         self._print_header(
-            text=f"{message.splitlines()[0] if message else ''} ◆\n{instruction if instruction else ''}", 
+            text=_prompt_text(message, instruction), 
             title=title,
             subtitle=subtitle,
             padding=padding
@@ -345,7 +449,7 @@ class InteractivePrompter:
             result = questionary.confirm(
                 message=message,
                 default=default,
-                style=PromptTheme.get_questionary_style(self.theme),
+                style=self._qstyle,
                 qmark="◆",
                 **kwargs,
             ).ask()
@@ -367,7 +471,7 @@ class InteractivePrompter:
         item: str = "",
         default: bool = False,
     ) -> bool:
-        message = f"◆ {action}" + (f" {item}" if item else "") + "?"
+        message = f"◆ {action} {item}?" if item else f"◆ {action}?"
         subtitle = f"Press Y to {action.lower()}, N to cancel"
         return self.confirm(message, default=default, instruction=subtitle) or False
     
@@ -383,8 +487,9 @@ class InteractivePrompter:
         validate: Optional[Callable] = None,
         **kwargs,
     ) -> Optional[str]:
+        questionary = _questionary()
         self._print_header(
-            text=f"{message.splitlines()[0] if message else ''} ◆\n{instruction if instruction else ''}", 
+            text=_prompt_text(message, instruction), 
             title=title, 
             subtitle=subtitle,
             padding=padding
@@ -394,7 +499,7 @@ class InteractivePrompter:
             result = questionary.text(
                 message=message,
                 default=default,
-                style=PromptTheme.get_questionary_style(self.theme),
+                style=self._qstyle,
                 qmark="◆",
                 validate=validate,
                 **kwargs,
@@ -420,8 +525,9 @@ class InteractivePrompter:
         validate: Optional[Callable] = None,
         **kwargs,
     ) -> Optional[str]:
+        questionary = _questionary()
         self._print_header(
-            text=f"{message.splitlines()[0] if message else ''} ◆\n{instruction if instruction else ''}", 
+            text=_prompt_text(message, instruction), 
             title=title,
             subtitle=subtitle,
             padding=padding
@@ -431,7 +537,7 @@ class InteractivePrompter:
             result = questionary.path(
                 message=message,
                 default=default,
-                style=PromptTheme.get_questionary_style(self.theme),
+                style=self._qstyle,
                 qmark="◆",
                 validate=validate,
                 **kwargs,
@@ -456,8 +562,9 @@ class InteractivePrompter:
         instruction: str = "Enter your password (hidden)",
         **kwargs,
     ) -> Optional[str]:
+        questionary = _questionary()
         self._print_header(
-            text=f"{message.splitlines()[0] if message else ''} ◆\n{instruction if instruction else ''}",
+            text=_prompt_text(message, instruction),
             title=title,
             subtitle=subtitle,
             padding=padding
@@ -466,7 +573,7 @@ class InteractivePrompter:
         try:
             result = questionary.password(
                 message=message,
-                style=PromptTheme.get_questionary_style(self.theme),
+                style=self._qstyle,
                 qmark="◆",
                 **kwargs,
             ).ask()
@@ -492,8 +599,9 @@ class InteractivePrompter:
         instruction: str = "Use Space to select, Enter to confirm",
         **kwargs,
     ) -> Optional[List[str]]:
+        questionary = _questionary()
         self._print_header(
-            text=f"{message.splitlines()[0] if message else ''} ◆\n{instruction if instruction else ''}",
+            text=_prompt_text(message, instruction),
             title=title,
             subtitle=subtitle,
             padding=padding
@@ -502,7 +610,7 @@ class InteractivePrompter:
         styled_choices = []
         for choice in choices:
             if isinstance(choice, str):
-                styled_choices.append(Choice(choice, value=choice))
+                styled_choices.append(questionary.Choice(choice, value=choice))
             else:
                 styled_choices.append(choice)
         
@@ -511,7 +619,7 @@ class InteractivePrompter:
                 message=message,
                 choices=styled_choices,
                 default=default,
-                style=PromptTheme.get_questionary_style(self.theme),
+                style=self._qstyle,
                 qmark="◆",
                 **kwargs,
             ).ask()
@@ -534,6 +642,7 @@ class InteractivePrompter:
         options: List[str] = None,
         instruction: str = "Select multiple options with Space",
     ) -> Optional[List[str]]:
+        questionary = _questionary()
         self._print_header(
             text=instruction, 
             title=title,
@@ -541,13 +650,13 @@ class InteractivePrompter:
             padding=padding
         )
         
-        choices = [Choice(opt, value=opt) for opt in options]
+        choices = [questionary.Choice(opt, value=opt) for opt in options]
         
         try:
             return questionary.checkbox(
                 message=f"{title}:",
                 choices=choices,
-                style=PromptTheme.get_questionary_style(self.theme),
+                style=self._qstyle,
                 qmark="◆",
             ).ask()
             
@@ -569,8 +678,9 @@ class InteractivePrompter:
         **kwargs,
     ) -> Optional[int]:
         """Create a styled number input prompt."""
+        questionary = _questionary()
         self._print_header(
-            text=f"{message.splitlines()[0] if message else ''} ◆\n{instruction if instruction else ''}", 
+            text=_prompt_text(message, instruction), 
             title=title,
             subtitle=subtitle,
             padding=padding
@@ -591,7 +701,7 @@ class InteractivePrompter:
             result = questionary.text(
                 message=message,
                 default=str(default),
-                style=PromptTheme.get_questionary_style(self.theme),
+                style=self._qstyle,
                 qmark="◆",
                 validate=validate_number,
                 **kwargs,
@@ -8,34 +8,446 @@ Fetches logs -> Parses events -> Aggregates metrics -> Detects anomalies -> Gene
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import contextlib
+import hashlib
 import json
+import multiprocessing
+import os
 import subprocess
 import sys
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 # Ensure repo root is importable BEFORE any other imports
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.agentX.shared.utils import PipelineError, load_config, load_yaml_config
+from src.agentX.shared.utils import (
+    PipelineError, json_dumps_bytes, json_loads, load_config, load_skill, load_yaml_config,
+)
+
+
+SKILLS = {
+    "fetch_logs": ".agents/skills/fetch_logs/scripts/run.py",
+    "parse_logs": ".agents/skills/parse_logs/scripts/run.py",
+    "aggregate_logs": ".agents/skills/aggregate_logs/scripts/run.py",
+    "detect_anomalies": ".agents/skills/detect_anomalies/scripts/run.py",
+    "aggregate_and_detect": ".agents/skills/aggregate_and_detect/scripts/run.py",
+    "high_hypothesis": ".agents/skills/high_hypothesis/scripts/run.py",
+    "generate_summary": ".agents/skills/generate_summary/scripts/run.py",
+}
+
+
+def _isolated() -> bool:
+    return os.environ.get("AGENTX_ISOLATE") == "1"
+
+
+def _call_skill(skill_path: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Call a skill function, wrapping failures.
+
+    Skills resolve their relative config and output paths against the repo
+    root themselves, so the process working directory is left alone.
+    """
+    try:
+        return func(*args)
+    except Exception as exc:
+        raise PipelineError(f"Skill {skill_path} failed: {exc}") from exc
+
+
+# Skill results on disk, one directory per skill, keyed by input digest;
+# opt-in with AGENTX_CACHE=1 and capped at the newest entries per skill
+_RESULT_CACHE_DIR = PROJECT_ROOT / ".cache" / "skills"
+_RESULT_CACHE_MAX_ENTRIES = 32
+_SHARED_UTILS = PROJECT_ROOT / "src" / "agentX" / "shared" / "utils.py"
+
+# Skills whose returned dict is their whole effect, mapped to a check that a
+# given result is safe to replay. Every other skill writes under output/ (and
+# stamps ids and times at run time), which a replay would silently skip.
+_CACHEABLE_SKILLS: dict[str, Callable[[dict[str, Any]], bool]] = {
+    # A parse with failures has also written output/parsing_failures.json
+    SKILLS["parse_logs"]: lambda result: not result.get("failed_count"),
+}
+
+# Sibling skill scripts a skill imports, so edits to them also miss the cache
+_SKILL_IMPORTS: dict[str, tuple[str, ...]] = {
+    SKILLS["aggregate_and_detect"]: (SKILLS["aggregate_logs"], SKILLS["detect_anomalies"]),
+}
+
+
+def _file_stamp(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _cache_path(skill_path: str, input_data: dict[str, Any]) -> Path | None:
+    """Where this skill's result for ``input_data`` is cached, if caching applies.
+
+    The digest covers the input plus the skill script, the skill scripts it
+    imports, the shared utils and any config file the input names, so editing
+    any of those misses the cache.
+    """
+    if os.environ.get("AGENTX_CACHE") != "1" or skill_path not in _CACHEABLE_SKILLS:
+        return None
+    files = {
+        value: _file_stamp(PROJECT_ROOT / value)
+        for value in input_data.values()
+        if isinstance(value, str) and value.endswith((".json", ".yaml", ".yml"))
+    }
+    scripts = [_file_stamp(PROJECT_ROOT / path) for path in (skill_path, *_SKILL_IMPORTS.get(skill_path, ()))]
+    try:
+        key = json_dumps_bytes([input_data, files, scripts, _file_stamp(_SHARED_UTILS)], sort_keys=True)
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(key, digest_size=20).hexdigest()
+    return _RESULT_CACHE_DIR / Path(skill_path).parent.parent.name / f"{digest}.json"
+
+
+def _read_cached(cache_path: Path | None) -> dict[str, Any] | None:
+    if cache_path is None:
+        return None
+    try:
+        result = json_loads(cache_path.read_bytes())
+        # Hits count as recent use for eviction
+        os.utime(cache_path)
+    except (OSError, ValueError):
+        return None
+    return result
+
+
+def _write_cached(skill_path: str, cache_path: Path | None, result: dict[str, Any]) -> None:
+    """Store a result atomically; a failed write only costs the next hit."""
+    if cache_path is None or not _CACHEABLE_SKILLS[skill_path](result):
+        return
+    try:
+        payload = json_dumps_bytes(result)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as f:
+            f.write(payload)
+        os.replace(f.name, cache_path)
+        _evict_cached(cache_path.parent)
+    except (OSError, TypeError):
+        pass
+
+
+def _evict_cached(cache_dir: Path) -> None:
+    """Drop all but the most recently used entries in one skill's cache."""
+    entries = sorted(cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+    for stale in entries[_RESULT_CACHE_MAX_ENTRIES:]:
+        stale.unlink(missing_ok=True)
+
+
+def _cached(
+    skill_path: str, input_data: dict[str, Any], compute: Callable[[], dict[str, Any]]
+) -> dict[str, Any]:
+    """Replay this call's cached result, or compute it and store it.
+
+    Every skill call goes through here, so the cache key and the rules for
+    what gets stored are applied in one place.
+    """
+    cache_path = _cache_path(skill_path, input_data)
+    result = _read_cached(cache_path)
+    if result is None:
+        result = compute()
+        _write_cached(skill_path, cache_path, result)
+    return result
 
 
 def run_skill(skill_path: str, input_data: dict[str, Any]) -> dict[str, Any]:
+    """Run a skill and return its result.
+
+    Skills are imported and called in-process, so ``input_data`` and the
+    returned dict are shared by reference with no JSON round-trip; skills
+    must not mutate their input. Set AGENTX_ISOLATE=1 to run each one in
+    its own ``uv run`` subprocess instead.
+
+    With AGENTX_CACHE=1, side-effect-free skills (see ``_CACHEABLE_SKILLS``)
+    replay results from ``.cache/skills`` for inputs seen before; a replay
+    carries the original run's timestamp.
+    """
+    if _isolated():
+        return _cached(skill_path, input_data, lambda: _run_skill_subprocess(skill_path, input_data))
+    return _cached(
+        skill_path, input_data, lambda: _call_skill(skill_path, load_skill(skill_path).run, input_data)
+    )
+
+
+# Chunked parsing on a process pool is opt-in with AGENTX_PARALLEL_PARSE=1
+# and only used for batches this large: each run pays ~0.1s per cold spawned
+# worker plus a serial pickle round-trip, which outweighs the parse itself
+# (~0.09s for the default 10k logs) until around 100k logs on 4+ cores
+_PARALLEL_MIN_LOGS = 100_000
+_PARALLEL_CHUNK = 5_000
+_POOL: ProcessPoolExecutor | None = None
+
+
+def _parallel_parse(n_logs: int) -> bool:
+    return (
+        os.environ.get("AGENTX_PARALLEL_PARSE") == "1"
+        and not _isolated()
+        and n_logs >= _PARALLEL_MIN_LOGS
+        and (os.cpu_count() or 1) > 1
+    )
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        # The warmup executor threads already exist by now, and forking a
+        # multi-threaded process can deadlock; spawned workers start clean
+        _POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        )
+        # Callers outside run_pipeline_async still get their workers reaped
+        atexit.register(_shutdown_pool)
+    return _POOL
+
+
+def _shutdown_pool() -> None:
+    """Stop the parse pool's workers; the next parallel parse starts a new one."""
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is not None:
+        atexit.unregister(_shutdown_pool)
+        pool.shutdown()
+
+
+def _parse_chunk(logs: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Worker entrypoint: parse one chunk of logs."""
+    return load_skill(SKILLS["parse_logs"]).parse_entries(logs)
+
+
+def _parse_logs_parallel(logs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Parse logs in chunks on the process pool and merge the results."""
+    skill_path = SKILLS["parse_logs"]
+    module = load_skill(skill_path)
+    workers = os.cpu_count() or 1
+    size = max(_PARALLEL_CHUNK, -(-len(logs) // workers))
+    chunks = [logs[i:i + size] for i in range(0, len(logs), size)]
+
+    try:
+        parts = list(_get_pool().map(_parse_chunk, chunks))
+    except PipelineError:
+        raise
+    except Exception as exc:
+        raise PipelineError(f"Skill {skill_path} failed: {exc}") from exc
+
+    events = [event for chunk_events, _ in parts for event in chunk_events]
+    failed = [failure for _, chunk_failed in parts for failure in chunk_failed]
+    return _call_skill(skill_path, module.build_result, events, failed)
+
+
+# Payloads above this size go through a temp file instead of the stdin pipe
+_INLINE_INPUT_LIMIT = 64 * 1024
+
+
+def _encode_skill_input(input_data: dict[str, Any]) -> tuple[bytes, Path | None]:
+    """Serialize skill input once, spilling large payloads to a temp file.
+
+    Returns the bytes to send on stdin and the temp file to remove afterwards.
+    """
+    payload = json_dumps_bytes(input_data)
+    if len(payload) <= _INLINE_INPUT_LIMIT:
+        return payload, None
+    with tempfile.NamedTemporaryFile(prefix="agentx-", suffix=".json", delete=False) as f:
+        f.write(payload)
+    return json_dumps_bytes({"input_file": f.name}), Path(f.name)
+
+
+# List fields sent one item per line rather than as a single document
+_STREAMED_FIELDS = ("logs", "events")
+
+
+def _stream_skill_input(input_data: dict[str, Any]) -> Iterator[bytes] | None:
+    """ND-JSON lines for an input carrying a streamed list, else None.
+
+    The header line holds everything but the list; each item follows on its
+    own line, so the full document is never built in memory.
+    """
+    for field in _STREAMED_FIELDS:
+        items = input_data.get(field)
+        if isinstance(items, list):
+            break
+    else:
+        return None
+    rest = {key: value for key, value in input_data.items() if key != field}
+
+    def lines() -> Iterator[bytes]:
+        yield json_dumps_bytes({"input": rest, "stream": field, "count": len(items)}) + b"\n"
+        for item in items:
+            yield json_dumps_bytes(item) + b"\n"
+
+    return lines()
+
+
+class SkillWorker:
+    """An isolated skill kept running in ``--serve`` mode between calls.
+
+    Requests and replies are single ND-JSON lines, so the interpreter and
+    ``uv`` start-up are paid once per pipeline run instead of once per call.
+    """
+
+    def __init__(self, skill_path: str):
+        self.skill_path = skill_path
+        self._lock = threading.Lock()
+        self._stderr: deque[bytes] = deque(maxlen=50)
+        self.proc = subprocess.Popen(
+            ["uv", "run", skill_path, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(PROJECT_ROOT)
+        )
+        # Drained in the background so a chatty skill cannot fill the pipe;
+        # the tail is reported if the worker dies
+        threading.Thread(target=self._stderr.extend, args=(self.proc.stderr,), daemon=True).start()
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def call(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        lines, input_file = _stream_skill_input(input_data), None
+        if lines is None:
+            stdin, input_file = _encode_skill_input(input_data)
+            lines = [stdin + b"\n"]
+        with self._lock:
+            try:
+                self.proc.stdin.writelines(lines)
+                self.proc.stdin.flush()
+                line = self.proc.stdout.readline()
+            except BrokenPipeError:
+                line = b""
+            finally:
+                if input_file is not None:
+                    input_file.unlink(missing_ok=True)
+        if not line:
+            code = self.proc.wait()
+            stderr = b"".join(self._stderr).decode(errors="replace")
+            raise PipelineError(f"Skill {self.skill_path} failed: worker exited ({code}) {stderr}")
+        reply = json_loads(line)
+        if "error" in reply:
+            raise PipelineError(f"Skill {self.skill_path} failed: Error: {reply['error']}")
+        return reply["result"]
+
+    def close(self) -> None:
+        if self.alive():
+            self.proc.stdin.close()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+
+
+# Live workers while skill_workers() is active; None means one-shot processes
+_WORKERS: dict[str, SkillWorker] | None = None
+
+
+@contextlib.contextmanager
+def skill_workers() -> Iterator[None]:
+    """Reuse one ``--serve`` worker per isolated skill until the block exits."""
+    global _WORKERS
+    if _WORKERS is not None:
+        yield
+        return
+    _WORKERS = {}
+    try:
+        yield
+    finally:
+        workers, _WORKERS = _WORKERS, None
+        for worker in workers.values():
+            worker.close()
+
+
+def _worker(skill_path: str) -> SkillWorker | None:
+    if _WORKERS is None:
+        return None
+    worker = _WORKERS.get(skill_path)
+    if worker is None or not worker.alive():
+        worker = _WORKERS[skill_path] = SkillWorker(skill_path)
+    return worker
+
+
+def _run_skill_subprocess(skill_path: str, input_data: dict[str, Any]) -> dict[str, Any]:
     """Run a skill script via subprocess and return JSON result."""
-    result = subprocess.run(
+    worker = _worker(skill_path)
+    if worker is not None:
+        return worker.call(input_data)
+
+    lines = _stream_skill_input(input_data)
+    if lines is not None:
+        return _run_skill_streamed(skill_path, lines)
+
+    stdin, input_file = _encode_skill_input(input_data)
+    try:
+        result = subprocess.run(
+            ["uv", "run", skill_path],
+            input=stdin,
+            capture_output=True,
+            cwd=str(PROJECT_ROOT)
+        )
+    finally:
+        if input_file is not None:
+            input_file.unlink(missing_ok=True)
+    if result.returncode != 0:
+        raise PipelineError(f"Skill {skill_path} failed: {result.stderr.decode(errors='replace')}")
+    return json_loads(result.stdout)
+
+
+def _run_skill_streamed(skill_path: str, lines: Iterator[bytes]) -> dict[str, Any]:
+    """One-shot subprocess fed line by line while its output is collected."""
+    proc = subprocess.Popen(
         ["uv", "run", skill_path],
-        input=json.dumps(input_data),
-        capture_output=True,
-        text=True,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         cwd=str(PROJECT_ROOT)
     )
-    if result.returncode != 0:
-        raise PipelineError(f"Skill {skill_path} failed: {result.stderr}")
-    return json.loads(result.stdout)
-
 
-def step_fetch_logs(sources: list[dict[str, Any]], time_range: str, max_logs: int) -> dict[str, Any]:
+    def feed() -> None:
+        try:
+            proc.stdin.writelines(lines)
+        except BrokenPipeError:
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+    stderr: list[bytes] = []
+    threads = [
+        threading.Thread(target=feed, daemon=True),
+        threading.Thread(target=lambda: stderr.append(proc.stderr.read()), daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+    stdout = proc.stdout.read()
+    for thread in threads:
+        thread.join()
+    if proc.wait() != 0:
+        raise PipelineError(f"Skill {skill_path} failed: {b''.join(stderr).decode(errors='replace')}")
+    return json_loads(stdout)
+
+
+async def run_skill_async(skill_path: str, input_data: dict[str, Any]) -> dict[str, Any]:
+    """Awaitable run_skill; isolated skills run without blocking the event loop."""
+    if not _isolated():
+        return run_skill(skill_path, input_data)
+    # The worker, streaming and one-shot paths all block on pipes, so the
+    # whole call, cache included, runs on the default executor
+    return await asyncio.get_running_loop().run_in_executor(None, run_skill, skill_path, input_data)
+
+
+async def step_fetch_logs(sources: list[dict[str, Any]], time_range: str, max_logs: int) -> dict[str, Any]:
     """Step 1: Fetch logs from configured sources."""
     print("\n[1/5] Fetching logs...")
     input_data = {
@@ -43,24 +455,29 @@ def step_fetch_logs(sources: list[dict[str, Any]], time_range: str, max_logs: in
         "time_range": time_range,
         "max_logs": max_logs
     }
-    result = run_skill(".agents/skills/fetch_logs/scripts/run.py", input_data)
+    result = await run_skill_async(SKILLS["fetch_logs"], input_data)
     print(f"  ✓ Fetched {result.get('total_fetched', 0)} logs")
     return result
 
 
-def step_parse_logs(logs: list[dict[str, Any]], patterns_file: str) -> dict[str, Any]:
+async def step_parse_logs(logs: list[dict[str, Any]], patterns_file: str) -> dict[str, Any]:
     """Step 2: Parse and normalize log entries."""
     print("\n[2/5] Parsing logs...")
     input_data = {
         "logs": logs,
         "parsing_rules": patterns_file
     }
-    result = run_skill(".agents/skills/parse_logs/scripts/run.py", input_data)
+    if _parallel_parse(len(logs)):
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, _cached, SKILLS["parse_logs"], input_data, lambda: _parse_logs_parallel(logs)
+        )
+    else:
+        result = await run_skill_async(SKILLS["parse_logs"], input_data)
     print(f"  ✓ Parsed {result.get('parsed_count', 0)} events")
     return result
 
 
-def step_aggregate_metrics(events: list[dict[str, Any]], time_range: str, baseline_file: str) -> dict[str, Any]:
+async def step_aggregate_metrics(events: list[dict[str, Any]], time_range: str, baseline_file: str) -> dict[str, Any]:
     """Step 3: Aggregate events into metrics."""
     print("\n[3/5] Computing metrics...")
     input_data = {
@@ -68,26 +485,49 @@ def step_aggregate_metrics(events: list[dict[str, Any]], time_range: str, baseli
         "time_range": time_range,
         "baseline_file": baseline_file
     }
-    result = run_skill(".agents/skills/aggregate_logs/scripts/run.py", input_data)
+    result = await run_skill_async(SKILLS["aggregate_logs"], input_data)
     error_rate = result.get("error_rate", 0) * 100
     print(f"  ✓ Processed {result.get('total_events', 0)} events, {error_rate:.1f}% error rate")
     return result
 
 
-def step_detect_anomalies(metrics: dict[str, Any], thresholds_file: str) -> dict[str, Any]:
+async def step_detect_anomalies(metrics: dict[str, Any], thresholds_file: str) -> dict[str, Any]:
     """Step 4: Detect anomalies in metrics."""
     print("\n[4/5] Detecting anomalies...")
     input_data = {
         "metrics": metrics,
         "thresholds": thresholds_file
     }
-    result = run_skill(".agents/skills/detect_anomalies/scripts/run.py", input_data)
+    result = await run_skill_async(SKILLS["detect_anomalies"], input_data)
     count = result.get("total_anomalies", 0)
     print(f"  ✓ Found {count} anomaly/anomalies")
     return result
 
 
-def step_generate_summary(
+async def step_aggregate_and_detect(
+    events: list[dict[str, Any]],
+    time_range: str,
+    baseline_file: str,
+    thresholds_file: str
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Steps 3 and 4 in one skill call; returns (metrics, anomaly result)."""
+    print("\n[3/5] Computing metrics...")
+    input_data = {
+        "events": events,
+        "time_range": time_range,
+        "baseline_file": baseline_file,
+        "thresholds": thresholds_file
+    }
+    result = await run_skill_async(SKILLS["aggregate_and_detect"], input_data)
+    metrics = result.pop("metrics")
+    error_rate = metrics.get("error_rate", 0) * 100
+    print(f"  ✓ Processed {metrics.get('total_events', 0)} events, {error_rate:.1f}% error rate")
+    print("\n[4/5] Detecting anomalies...")
+    print(f"  ✓ Found {result.get('total_anomalies', 0)} anomaly/anomalies")
+    return metrics, result
+
+
+async def step_generate_summary(
     metrics: dict[str, Any],
     anomalies: list[dict[str, Any]],
     hypotheses: list[dict[str, Any]],
@@ -103,13 +543,52 @@ def step_generate_summary(
         "time_range": time_range,
         "environment": environment
     }
-    result = run_skill(".agents/skills/generate_summary/scripts/run.py", input_data)
+    result = await run_skill_async(SKILLS["generate_summary"], input_data)
     print(f"  ✓ Summary written to output/summary.md")
     return result
 
 
 def run_pipeline(config: dict[str, Any]) -> dict[str, Any]:
-    """Execute the complete log analysis pipeline."""
+    """Execute the complete log analysis pipeline.
+
+    Blocks until the run finishes. Async callers should await
+    ``run_pipeline_async`` instead; when called from inside a running event
+    loop this falls back to a private loop on a helper thread, which blocks
+    the caller's loop for the whole run.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_pipeline_async(config))
+    result: list[dict[str, Any]] = []
+    errors: list[BaseException] = []
+
+    def target() -> None:
+        try:
+            result.append(asyncio.run(run_pipeline_async(config)))
+        except BaseException as exc:
+            errors.append(exc)
+
+    thread = threading.Thread(target=target, name="agentx-pipeline")
+    thread.start()
+    thread.join()
+    if errors:
+        raise errors[0]
+    return result[0]
+
+
+async def run_pipeline_async(config: dict[str, Any]) -> dict[str, Any]:
+    """Execute the pipeline, importing later skills while logs are fetched."""
+    # Isolated skills stay up as workers for the whole run, as does the
+    # parse pool if this run started one
+    try:
+        with skill_workers():
+            return await _run_pipeline_steps(config)
+    finally:
+        _shutdown_pool()
+
+
+async def _run_pipeline_steps(config: dict[str, Any]) -> dict[str, Any]:
     time_range = config.get("time_range", "24h")
     max_logs = config.get("max_logs", 10000)
     environment = config.get("environment", "production")
@@ -123,26 +602,35 @@ def run_pipeline(config: dict[str, Any]) -> dict[str, Any]:
     baseline_file = config.get("baseline_metrics_file", "src/agentX/config/baseline_metrics.json")
     thresholds_file = config.get("anomaly_thresholds_file", "src/agentX/config/anomaly_thresholds.yaml")
 
-    fetch_result = step_fetch_logs(sources, time_range, max_logs)
+    # Executor jobs start immediately, so imports overlap the fetch step
+    warmup = []
+    if not _isolated():
+        loop = asyncio.get_running_loop()
+        warmup = [
+            loop.run_in_executor(None, load_skill, path)
+            for name, path in SKILLS.items() if name != "fetch_logs"
+        ]
+
+    fetch_result = await step_fetch_logs(sources, time_range, max_logs)
+    # Import errors resurface when the skill is actually run
+    await asyncio.gather(*warmup, return_exceptions=True)
     logs = fetch_result.get("logs", [])
     if not logs:
         print("\n⚠ No logs fetched. Aborting.")
         return {"status": "aborted", "reason": "no_logs"}
 
-    parse_result = step_parse_logs(logs, patterns_file)
+    parse_result = await step_parse_logs(logs, patterns_file)
     events = parse_result.get("events", [])
     if not events:
         print("\n⚠ No events parsed. Aborting.")
         return {"status": "aborted", "reason": "no_events"}
 
-    metrics = step_aggregate_metrics(events, time_range, baseline_file)
-
-    anomaly_result = step_detect_anomalies(metrics, thresholds_file)
+    metrics, anomaly_result = await step_aggregate_and_detect(events, time_range, baseline_file, thresholds_file)
     anomalies = anomaly_result.get("anomalies", [])
 
     print("\n[H] Generating hypotheses...")
     if anomalies:
-        hypothesis_result = run_skill(".agents/skills/high_hypothesis/scripts/run.py", {
+        hypothesis_result = await run_skill_async(SKILLS["high_hypothesis"], {
             "anomalies": anomalies,
             "metrics": metrics,
             "context": {}
@@ -153,7 +641,7 @@ def run_pipeline(config: dict[str, Any]) -> dict[str, Any]:
         hypotheses = []
         print("  ✓ No anomalies to analyze")
 
-    summary_result = step_generate_summary(metrics, anomalies, hypotheses, time_range, environment)
+    summary_result = await step_generate_summary(metrics, anomalies, hypotheses, time_range, environment)
 
     return {
         "status": "success",
@@ -4,12 +4,26 @@ Shared utilities for AgentX pipeline.
 
 from __future__ import annotations
 
+import copy
+import importlib.util
+import itertools
 import json
 import re
 import subprocess
 import sys
+import threading
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+_TIME_RE = re.compile(r"(\d+)\s*(h|m|d|w)")
+_TIME_UNIT_MINUTES = {"m": 1, "h": 60, "d": 24 * 60, "w": 7 * 24 * 60}
 
 
 class PipelineError(RuntimeError):
@@ -26,10 +40,183 @@ def run_command(cmd: list[str]) -> None:
         raise PipelineError(f"Command failed ({exc.returncode}): {' '.join(cmd)}") from exc
 
 
+def json_dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, sort_keys=sort_keys).encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_skill_input(stream=None) -> Any:
+    """Read a skill's JSON input from stdin.
+    
+    Large payloads may be handed over in a temp file instead, in which case
+    stdin only carries ``{"input_file": "<path>"}``. Big lists can also be
+    streamed: a ``{"input": ..., "stream": "<field>", "count": n}`` header
+    line followed by one item per line.
+    """
+    stream = stream or sys.stdin
+    first = stream.readline()
+    try:
+        head = json_loads(first)
+    except ValueError:
+        head = None
+    if _is_stream_header(head):
+        return _collect_stream(head, stream)
+    rest = stream.read()
+    if head is not None and not rest.strip():
+        return _resolve_skill_input(head)
+    return _resolve_skill_input(json.loads(first + rest))
+
+
+def _resolve_skill_input(data: Any) -> Any:
+    if isinstance(data, dict) and data.keys() == {"input_file"}:
+        return json_loads(Path(data["input_file"]).read_bytes())
+    return data
+
+
+def _is_stream_header(data: Any) -> bool:
+    return isinstance(data, dict) and data.keys() == {"input", "stream", "count"}
+
+
+def _collect_stream(header: dict[str, Any], lines) -> dict[str, Any]:
+    """Rebuild a streamed input from its header and the next ``count`` lines.
+    
+    All ``count`` lines are consumed before any is parsed, so a bad item
+    cannot leave the rest of the stream to be read as new requests.
+    """
+    count = header["count"]
+    raw = list(itertools.islice(lines, count))
+    if len(raw) < count:
+        raise ValueError(f"Stream ended after {len(raw)} of {count} items")
+    data = dict(header["input"])
+    data[header["stream"]] = [json_loads(line) for line in raw]
+    return data
+
+
+def write_skill_output(output: Any, stream=None) -> None:
+    """Write a skill's JSON result to stdout.
+    
+    Terminals get indented JSON; pipes get one compact line, which is what
+    the pipeline reads back.
+    """
+    stream = stream or sys.stdout
+    if stream.isatty():
+        print(json.dumps(output, indent=2), file=stream)
+        return
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(json.dumps(output) + "\n")
+        return
+    stream.flush()
+    buffer.write(json_dumps_bytes(output) + b"\n")
+    buffer.flush()
+
+
+def serve_skill(run: Callable[[Any], Any]) -> None:
+    """Answer ND-JSON requests on stdin until EOF (a skill's ``--serve`` mode).
+    
+    Each request is one line (or one streamed header plus its item lines),
+    as ``read_skill_input`` accepts it; each reply is one ``{"result": ...}``
+    or ``{"error": "..."}`` line.
+    """
+    out = sys.stdout.buffer
+    # Stray prints from the skill must not land in the reply stream
+    sys.stdout = sys.stderr
+    lines = iter(sys.stdin.buffer)
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            request = json_loads(line)
+            if _is_stream_header(request):
+                request = _collect_stream(request, lines)
+            reply = json_dumps_bytes({"result": run(_resolve_skill_input(request))})
+        except Exception as e:
+            reply = json_dumps_bytes({"error": str(e)})
+        out.write(reply + b"\n")
+        out.flush()
+
+
+# Skill script paths passed to load_skill are relative to the repo root
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+
+# Loaded skill modules and their import locks, keyed by skill script path;
+# _SKILL_LOCKS_GUARD is only held while looking up or adding a lock
+_SKILL_MODULES: dict[str, ModuleType] = {}
+_SKILL_LOCKS: dict[str, threading.Lock] = {}
+_SKILL_LOCKS_GUARD = threading.Lock()
+
+
+def load_skill(skill_path: str) -> ModuleType:
+    """Import a skill script once per process and return its module.
+    
+    Each path has its own lock, so imports of different skills run side by
+    side; a failed import is not cached and is retried on the next call.
+    """
+    module = _SKILL_MODULES.get(skill_path)
+    if module is not None:
+        return module
+    with _SKILL_LOCKS_GUARD:
+        lock = _SKILL_LOCKS.setdefault(skill_path, threading.Lock())
+    with lock:
+        module = _SKILL_MODULES.get(skill_path)
+        if module is None:
+            module = _SKILL_MODULES[skill_path] = _import_skill(skill_path)
+        return module
+
+
+def _import_skill(skill_path: str) -> ModuleType:
+    module_name = skill_path.removesuffix(".py").replace("/", ".").lstrip(".")
+    spec = importlib.util.spec_from_file_location(module_name, _REPO_ROOT / skill_path)
+    if spec is None or spec.loader is None:
+        raise PipelineError(f"Skill {skill_path} could not be loaded")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception as exc:
+        sys.modules.pop(module_name, None)
+        raise PipelineError(f"Skill {skill_path} failed to import: {exc}") from exc
+    return module
+
+
+# Parsed YAML configs keyed by (parser, path), reused until mtime/size change.
+# Hits are deep-copied (callers such as detect_anomalies fill in defaults),
+# which is still 7-12x cheaper than a CSafeLoader parse of the repo's YAML
+# files; JSON parses about as fast as a copy, so it is not cached
+_CONFIG_CACHE: dict[tuple[str, str], tuple[tuple[int, int], Any]] = {}
+
+
+def _yaml_load(config_path: Path) -> Any:
+    """Parse a YAML file, using the libyaml C loader when available."""
+    import yaml
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _load_cached(config_path: Path, parse: Callable[[Path], Any]) -> Any:
+    """Parse a config file once per change and hand out independent copies."""
+    stat = config_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = (parse.__name__, str(config_path.absolute()))
+    hit = _CONFIG_CACHE.get(key)
+    if hit is None or hit[0] != stamp:
+        hit = _CONFIG_CACHE[key] = (stamp, parse(config_path))
+    # Callers are free to mutate what they get back
+    return copy.deepcopy(hit[1])
+
+
 def load_config(config_path: Path | str | None = None) -> dict[str, Any]:
     """Load config file (JSON or YAML) from the repo root."""
-    import yaml
-    
     if config_path is None:
         config_path = Path(__file__).resolve().parent.parent.parent / "config.json"
     elif isinstance(config_path, str):
@@ -40,15 +227,13 @@ def load_config(config_path: Path | str | None = None) -> dict[str, Any]:
     
     try:
         if config_path.suffix in [".yaml", ".yml"]:
-            with open(config_path, "r") as f:
-                return yaml.safe_load(f)
+            return _load_cached(config_path, _yaml_load)
         else:
             # Try JSON first, fallback to YAML
             try:
-                return json.loads(config_path.read_text(encoding="utf-8"))
+                return json_loads(config_path.read_bytes())
             except json.JSONDecodeError:
-                with open(config_path, "r") as f:
-                    return yaml.safe_load(f)
+                return _load_cached(config_path, _yaml_load)
     except Exception as e:
         print(f"Error loading config {config_path}: {e}", file=sys.stderr)
         return None
@@ -56,14 +241,12 @@ def load_config(config_path: Path | str | None = None) -> dict[str, Any]:
 
 def load_yaml_config(config_path: Path | str) -> dict[str, Any] | None:
     """Load YAML configuration file."""
-    import yaml
     if isinstance(config_path, str):
         config_path = Path(config_path)
     if not config_path.exists():
         return None
     try:
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f)
+        return _load_cached(config_path, _yaml_load)
     except Exception as e:
         print(f"Error loading config {config_path}: {e}", file=sys.stderr)
         return None
@@ -77,8 +260,19 @@ def parse_time_range(time_range: str) -> int | None:
     if not time_range:
         return None
 
-    pattern = r"(\d+)\s*(h|m|d|w)"
-    match = re.match(pattern, time_range.strip().lower())
+    text = time_range.strip().lower()
+
+    # Fast path for the usual "<digits><unit>"; anything else (e.g. a space
+    # before the unit) goes through the regex
+    i = 0
+    while i < len(text) and text[i].isdecimal():
+        i += 1
+    if i:
+        multiplier = _TIME_UNIT_MINUTES.get(text[i:i + 1])
+        if multiplier is not None:
+            return int(text[:i]) * multiplier
+
+    match = _TIME_RE.match(text)
 
     if not match:
         return None
@@ -147,14 +341,20 @@ def parse_timestamp(timestamp_str: str):
 
 def clamp(value: float, low: float, high: float) -> float:
     """Clamp a value to a range."""
-    return max(low, min(value, high))
+    # Same result as max(low, min(value, high)), NaN and low > high included,
+    # without the two builtin calls
+    value = high if high < value else value
+    return value if value > low else low
 
 
 def safe_divide(a: float, b: float, default: float = 0.0) -> float:
     """Safely divide two numbers."""
+    if b is None or b == 0:
+        return default
+    # Only non-numeric operands can still fail here
     try:
-        return a / b if b != 0 else default
-    except (TypeError, ZeroDivisionError):
+        return a / b
+    except TypeError:
         return default
 
 